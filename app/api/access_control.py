@@ -0,0 +1,55 @@
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.api.admin_auth import authorize_admin_request, record_admin_audit
+from app.api.worker_auth import authorize_worker_request
+
+ADMIN_PREFIX = "/v1/admin"
+WORKER_PREFIX = "/worker"
+_PROTECTED_PREFIXES = (ADMIN_PREFIX, WORKER_PREFIX)
+
+
+class AccessControlMiddleware:
+    """Admin auth + audit and worker auth in a single pass; other routes are forwarded untouched."""
+
+    SENSITIVE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(_PROTECTED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        if scope["path"].startswith(WORKER_PREFIX):
+            denied = await authorize_worker_request(request)
+            if denied is not None:
+                await denied(scope, receive, send)
+                return
+            await self.app(scope, receive, send)
+            return
+
+        denied = await authorize_admin_request(request)
+        if denied is not None:
+            await denied(scope, receive, send)
+            return
+
+        request.state.explicit_admin_audit = False
+        if request.method not in self.SENSITIVE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        body_bytes = await request.body()
+        body_replayed = False
+
+        async def replay_receive() -> Message:
+            nonlocal body_replayed
+            if not body_replayed:
+                body_replayed = True
+                return {"type": "http.request", "body": body_bytes, "more_body": False}
+            return await receive()
+
+        await self.app(scope, replay_receive, send)
+        await record_admin_audit(request, body_bytes)
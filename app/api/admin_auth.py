@@ -10,7 +10,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.exception_handlers import http_exception_handler
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.security.utils import get_authorization_scheme_param
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
 
 from app.settings import settings
 from app.infra.logging import update_log_context
@@ -231,88 +231,71 @@ async def verify_admin_or_dispatcher(
     return identity
 
 
-class AdminAccessMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):  # type: ignore[override]
-        if not request.url.path.startswith("/v1/admin"):
-            return await call_next(request)
-
-        cached: AdminIdentity | None = getattr(request.state, "admin_identity", None)
-        if cached:
-            return await call_next(request)
-
-        saas_identity = getattr(request.state, "saas_identity", None)
-        if saas_identity:
-            return await call_next(request)
-
-        saas_identity_error: HTTPException | None = getattr(request.state, "saas_identity_error", None)
-        authorization: str = request.headers.get("Authorization", "")
-        has_bearer = authorization.lower().startswith("bearer ")
-
-        if saas_identity_error:
-            return await http_exception_handler(request, saas_identity_error)
-
-        if has_bearer:
-            unauthorized = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
-            return await http_exception_handler(request, unauthorized)
-
-        if not settings.legacy_basic_auth_enabled:
-            return await http_exception_handler(request, _build_auth_exception())
-
-        try:
-            credentials = _credentials_from_header(request)
-            identity = _authenticate_credentials(credentials)
-            _assert_permissions(identity, [AdminPermission.VIEW])
-            request.state.admin_identity = identity
-            request.state.current_org_id = getattr(request.state, "current_org_id", None) or identity.org_id
-            set_current_org_id(request.state.current_org_id)
-            return await call_next(request)
-        except HTTPException as exc:
-            return await http_exception_handler(request, exc)
-
-
-class AdminAuditMiddleware(BaseHTTPMiddleware):
-    SENSITIVE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
-
-    async def dispatch(self, request: Request, call_next):  # type: ignore[override]
-        should_audit = request.url.path.startswith("/v1/admin") and request.method in self.SENSITIVE_METHODS
-        body_bytes: bytes | None = None
-        if should_audit:
-            body_bytes = await request.body()
-            request._body = body_bytes
-
-        request.state.explicit_admin_audit = False
-        response = await call_next(request)
-        already_logged = getattr(request.state, "explicit_admin_audit", False)
-
-        if should_audit and not already_logged:
-            from app.domain.admin_audit import service as audit_service
-
-            identity: AdminIdentity | None = getattr(request.state, "admin_identity", None)
-            if identity is None:
-                return response
-
-            before = _safe_json(body_bytes)
-            raw_after = getattr(response, "body", None)
-            after = _safe_json(raw_after if isinstance(raw_after, (bytes, bytearray)) else None)
-            session_factory = getattr(request.app.state, "db_session_factory", None)
-            if session_factory is None:
-                return response
-            try:
-                async with session_factory() as session:
-                    await audit_service.record_action(
-                        session,
-                        identity=identity,
-                        action=f"{request.method} {request.url.path}",
-                        resource_type=None,
-                        resource_id=None,
-                        before=before,
-                        after=after,
-                    )
-                    await session.commit()
-            except Exception:  # noqa: BLE001
-                logger.exception("admin_audit_failed")
-                return response
-        return response
+async def authorize_admin_request(request: Request) -> Response | None:
+    """Authenticate an ``/v1/admin`` request, returning an error response when access is denied."""
+
+    cached: AdminIdentity | None = getattr(request.state, "admin_identity", None)
+    if cached:
+        return None
+
+    saas_identity = getattr(request.state, "saas_identity", None)
+    if saas_identity:
+        return None
+
+    saas_identity_error: HTTPException | None = getattr(request.state, "saas_identity_error", None)
+    authorization: str = request.headers.get("Authorization", "")
+    has_bearer = authorization.lower().startswith("bearer ")
+
+    if saas_identity_error:
+        return await http_exception_handler(request, saas_identity_error)
+
+    if has_bearer:
+        unauthorized = HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Unauthorized")
+        return await http_exception_handler(request, unauthorized)
+
+    if not settings.legacy_basic_auth_enabled:
+        return await http_exception_handler(request, _build_auth_exception())
+
+    try:
+        credentials = _credentials_from_header(request)
+        identity = _authenticate_credentials(credentials)
+        _assert_permissions(identity, [AdminPermission.VIEW])
+    except HTTPException as exc:
+        return await http_exception_handler(request, exc)
+    request.state.admin_identity = identity
+    request.state.current_org_id = getattr(request.state, "current_org_id", None) or identity.org_id
+    set_current_org_id(request.state.current_org_id)
+    return None
+
+
+async def record_admin_audit(request: Request, body_bytes: bytes | None) -> None:
+    """Record an implicit audit entry for an admin write the route did not log itself."""
+
+    if getattr(request.state, "explicit_admin_audit", False):
+        return
+    identity: AdminIdentity | None = getattr(request.state, "admin_identity", None)
+    if identity is None:
+        return
+    session_factory = getattr(request.app.state, "db_session_factory", None)
+    if session_factory is None:
+        return
+
+    from app.domain.admin_audit import service as audit_service
+
+    try:
+        async with session_factory() as session:
+            await audit_service.record_action(
+                session,
+                identity=identity,
+                action=f"{request.method} {request.url.path}",
+                resource_type=None,
+                resource_id=None,
+                before=_safe_json(body_bytes),
+                after=None,
+            )
+            await session.commit()
+    except Exception:  # noqa: BLE001
+        logger.exception("admin_audit_failed")
 
 
 def _safe_json(payload: Optional[bytes]) -> dict | list | None:
@@ -1,6 +1,7 @@
 import logging
 import uuid
-from ipaddress import ip_address, ip_network
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi import Request
@@ -15,6 +16,17 @@ from app.settings import settings
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _allowlist_networks(cidrs: tuple[str, ...]) -> tuple[IPv4Network | IPv6Network, ...]:
+    networks = []
+    for cidr in cidrs:
+        try:
+            networks.append(ip_network(cidr, strict=False))
+        except ValueError:
+            logger.warning("admin_ip_allowlist_invalid_cidr", extra={"extra": {"cidr": cidr}})
+    return tuple(networks)
+
+
 class AdminSafetyMiddleware(BaseHTTPMiddleware):
     WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 
@@ -23,7 +35,7 @@ class AdminSafetyMiddleware(BaseHTTPMiddleware):
         self.app_settings = app_settings
 
     async def dispatch(self, request: Request, call_next):  # type: ignore[override]
-        path = request.url.path
+        path = request.scope["path"]
         if not self._is_protected_path(path):
             return await call_next(request)
 
@@ -83,15 +95,7 @@ class AdminSafetyMiddleware(BaseHTTPMiddleware):
         except ValueError:
             return True
 
-        for cidr in cidrs:
-            try:
-                if ip in ip_network(cidr, strict=False):
-                    return False
-            except ValueError:
-                logger.warning(
-                    "admin_ip_allowlist_invalid_cidr", extra={"extra": {"cidr": cidr}}
-                )
-        return True
+        return not any(ip in network for network in _allowlist_networks(tuple(cidrs)))
 
     def _log_denial(self, request: Request, *, reason: str, client_ip: str) -> None:
         request_id = (
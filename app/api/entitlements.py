@@ -15,6 +15,8 @@ from app.infra.db import get_db_session
 from app.infra.org_context import set_current_org_id
 from app.settings import settings
 
+logger = logging.getLogger(__name__)
+
 
 def resolve_org_id(request: Request) -> uuid.UUID:
     error: HTTPException | None = getattr(request.state, "saas_identity_error", None)
@@ -41,7 +43,6 @@ def resolve_org_id(request: Request) -> uuid.UUID:
         set_current_org_id(org_uuid)
         return org_uuid
     if header_value and not allow_test_header:
-        logger = logging.getLogger(__name__)
         logger.debug("ignored_test_org_header", extra={"extra": {"reason": "disabled"}})
     set_current_org_id(settings.default_org_id)
     request.state.current_org_id = settings.default_org_id
@@ -15,7 +15,7 @@ class AdminMfaMiddleware(BaseHTTPMiddleware):
         self._required_roles = {role.lower() for role in getattr(app_settings, "admin_mfa_required_roles", [])}
 
     async def dispatch(self, request: Request, call_next):  # type: ignore[override]
-        path = request.url.path
+        path = request.scope["path"]
         if not (path.startswith("/v1/admin") or path.startswith("/v1/iam")):
             return await call_next(request)
         if not getattr(self.app_settings, "admin_mfa_required", False):
@@ -1,9 +1,11 @@
-import uuid
 from http import HTTPStatus
 from typing import Any
 
+import orjson
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+
+from app.infra.request_id import next_request_id
 
 PROBLEM_TYPE_VALIDATION = "https://example.com/problems/validation-error"
 PROBLEM_TYPE_DOMAIN = "https://example.com/problems/domain-error"
@@ -11,11 +13,20 @@ PROBLEM_TYPE_RATE_LIMIT = "https://example.com/problems/rate-limit"
 PROBLEM_TYPE_SERVER = "https://example.com/problems/server-error"
 
 
+class ProblemJSONResponse(JSONResponse):
+    media_type = "application/problem+json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 def _resolve_request_id(request: Request) -> str:
-    request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
+    # request.state is a view over scope["state"]; read the dict directly on the error path.
+    state = request.scope.setdefault("state", {})
+    request_id = state.get("request_id") or request.headers.get("X-Request-ID")
     if not request_id:
-        request_id = str(uuid.uuid4())
-    request.state.request_id = request_id
+        request_id = next_request_id()
+    state["request_id"] = request_id
     return request_id
 
 
@@ -59,11 +70,48 @@ def problem_details(
         "request_id": request_id,
         "errors": errors or [],
     }
-    response = JSONResponse(
-        status_code=status,
-        content=content,
-        headers=headers,
-        media_type="application/problem+json",
-    )
+    response = ProblemJSONResponse(status_code=status, content=content, headers=headers)
     response.headers.setdefault("X-Request-ID", request_id)
     return response
+
+
+class ProblemTemplate:
+    """Pre-serialized problem body for fixed errors; only the request id is encoded per response."""
+
+    def __init__(self, *, status: int, title: str, detail: str, type_: str | None = None) -> None:
+        self.status = status
+        head = orjson.dumps(
+            {
+                "type": _resolve_type(status, type_),
+                "title": _resolve_title(status, title),
+                "status": status,
+                "detail": detail,
+            }
+        )
+        self._head = head[:-1] + b',"request_id":'
+        self._tail = b',"errors":[]}'
+
+    def response(self, request: Request, *, headers: dict[str, str] | None = None) -> Response:
+        request_id = _resolve_request_id(request)
+        response = Response(
+            content=self._head + orjson.dumps(request_id) + self._tail,
+            status_code=self.status,
+            headers=headers,
+            media_type="application/problem+json",
+        )
+        response.headers.setdefault("X-Request-ID", request_id)
+        return response
+
+
+RATE_LIMIT_PROBLEM = ProblemTemplate(
+    status=status.HTTP_429_TOO_MANY_REQUESTS,
+    title="Too Many Requests",
+    detail="Rate limit exceeded",
+    type_=PROBLEM_TYPE_RATE_LIMIT,
+)
+SERVER_ERROR_PROBLEM = ProblemTemplate(
+    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    title="Internal Server Error",
+    detail="Unexpected error",
+    type_=PROBLEM_TYPE_SERVER,
+)
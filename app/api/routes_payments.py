@@ -10,6 +10,7 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy import or_, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -652,6 +653,16 @@ async def create_invoice_payment_checkout(
     )
 
 
+async def _claim_stripe_event(session: AsyncSession, **values: Any) -> StripeEvent | None:
+    """Insert the event row unless it already exists; ``None`` means another delivery owns it."""
+
+    bind = session.get_bind()
+    dialect_name = getattr(getattr(bind, "dialect", None), "name", "") if bind else ""
+    insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+    stmt = insert(StripeEvent).values(**values).on_conflict_do_nothing().returning(StripeEvent)
+    return (await session.scalars(stmt)).one_or_none()
+
+
 async def _stripe_webhook_handler(http_request: Request, session: AsyncSession) -> dict[str, bool]:
     payload = await http_request.body()
     sig_header = http_request.headers.get("Stripe-Signature")
@@ -715,10 +726,23 @@ async def _stripe_webhook_handler(http_request: Request, session: AsyncSession)
                 outcome = "ignored"
                 return {"received": True, "processed": False}
 
-            existing = await session.scalar(
-                select(StripeEvent).where(StripeEvent.event_id == str(event_id)).with_for_update()
+            # Claim the event id with a single INSERT .. ON CONFLICT DO NOTHING; only a redelivery
+            # (or a concurrent retry that lost the race) needs to read the existing row.
+            record = await _claim_stripe_event(
+                session,
+                event_id=str(event_id),
+                status="processing",
+                payload_hash=payload_hash,
+                org_id=ctx.org_id,
+                event_type=event_type,
+                event_created_at=event_created_at,
+                invoice_id=getattr(ctx.invoice, "invoice_id", None) or metadata_invoice_id,
+                booking_id=getattr(ctx.booking, "booking_id", None) or metadata_booking_id,
             )
-            if existing:
+            if record is None:
+                existing = await session.scalar(
+                    select(StripeEvent).where(StripeEvent.event_id == str(event_id)).with_for_update()
+                )
                 if existing.org_id and ctx.org_id and existing.org_id != ctx.org_id:
                     logger.warning(
                         "stripe_webhook_org_conflict",
@@ -769,20 +793,6 @@ async def _stripe_webhook_handler(http_request: Request, session: AsyncSession)
                     record.invoice_id = metadata_invoice_id or getattr(ctx.invoice, "invoice_id", None)
                 if not record.booking_id:
                     record.booking_id = metadata_booking_id or getattr(ctx.booking, "booking_id", None)
-            else:
-                invoice_id = getattr(ctx.invoice, "invoice_id", None) or metadata_invoice_id
-                booking_id = getattr(ctx.booking, "booking_id", None) or metadata_booking_id
-                record = StripeEvent(
-                    event_id=str(event_id),
-                    status="processing",
-                    payload_hash=payload_hash,
-                    org_id=ctx.org_id,
-                    event_type=event_type,
-                    event_created_at=event_created_at,
-                    invoice_id=invoice_id,
-                    booking_id=booking_id,
-                )
-                session.add(record)
 
             try:
                 processed = await _handle_webhook_event(
@@ -178,7 +178,7 @@ class PasswordChangeGateMiddleware(BaseHTTPMiddleware):
                         identity.must_change_password = True
 
         if identity and getattr(identity, "must_change_password", False):
-            path = request.url.path
+            path = request.scope["path"]
             if not any(path.startswith(prefix) for prefix in ALLOW_WHILE_MUST_CHANGE):
                 return problem_details(
                     request,
@@ -11,7 +11,7 @@ from fastapi import Depends, HTTPException, Request, status
 from fastapi.exception_handlers import http_exception_handler
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.security.utils import get_authorization_scheme_param
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import Response
 
 from app.settings import settings
 from app.infra.logging import update_log_context
@@ -187,23 +187,18 @@ async def require_worker(identity: WorkerIdentity = Depends(get_worker_identity)
     return identity
 
 
-class WorkerAccessMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):  # type: ignore[override]
-        if not request.url.path.startswith("/worker"):
-            return await call_next(request)
-
-        try:
-            credentials = _credentials_from_header(request)
-            identity = _authenticate_credentials(credentials) if credentials else _parse_session_token(
-                request.cookies.get(SESSION_COOKIE_NAME)
-            )
-            request.state.worker_identity = identity
-            request.state.current_org_id = getattr(request.state, "current_org_id", None) or identity.org_id
-            set_current_org_id(request.state.current_org_id)
-            update_log_context(
-                org_id=str(request.state.current_org_id), user_id=str(identity.username), role=identity.role
-            )
-            return await call_next(request)
-        except HTTPException as exc:
-            return await http_exception_handler(request, exc)
+async def authorize_worker_request(request: Request) -> Response | None:
+    """Authenticate a ``/worker`` request, returning an error response when access is denied."""
 
+    try:
+        credentials = _credentials_from_header(request)
+        identity = _authenticate_credentials(credentials) if credentials else _parse_session_token(
+            request.cookies.get(SESSION_COOKIE_NAME)
+        )
+    except HTTPException as exc:
+        return await http_exception_handler(request, exc)
+    request.state.worker_identity = identity
+    request.state.current_org_id = getattr(request.state, "current_org_id", None) or identity.org_id
+    set_current_org_id(request.state.current_org_id)
+    update_log_context(org_id=str(request.state.current_org_id), user_id=str(identity.username), role=identity.role)
+    return None
@@ -41,6 +41,7 @@ def _get_session_factory() -> async_sessionmaker[AsyncSession]:
                 "pool_size": settings.database_pool_size,
                 "max_overflow": settings.database_max_overflow,
                 "pool_timeout": settings.database_pool_timeout_seconds,
+                "pool_recycle": settings.database_pool_recycle_seconds,
                 "connect_args": {
                     "options": f"-c statement_timeout={int(settings.database_statement_timeout_ms)}",
                 },
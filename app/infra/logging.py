@@ -2,6 +2,7 @@ import contextvars
 import json
 import logging
 import re
+import sys
 from datetime import datetime, timezone
 from typing import Any, Dict
 
@@ -97,10 +98,19 @@ class RedactingJsonFormatter(logging.Formatter):
         return json.dumps(payload, ensure_ascii=False)
 
 
+_handler: logging.StreamHandler | None = None
+
+
 def configure_logging() -> None:
-    handler = logging.StreamHandler()
-    handler.setFormatter(RedactingJsonFormatter())
+    global _handler
     root = logging.getLogger()
     root.setLevel(logging.INFO)
+    # create_app runs many times per process in tests; keep the installed handler unless
+    # something replaced it or stderr was swapped out (e.g. by output capture).
+    if _handler is not None and _handler in root.handlers and _handler.stream is sys.stderr:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(RedactingJsonFormatter())
     root.handlers.clear()
     root.addHandler(handler)
+    _handler = handler
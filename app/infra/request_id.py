@@ -0,0 +1,18 @@
+import os
+from collections import deque
+
+_REQUEST_ID_BATCH_SIZE = 1024
+_request_id_pool: deque[str] = deque()
+# Forked workers must not hand out ids pre-generated in the parent process.
+os.register_at_fork(after_in_child=_request_id_pool.clear)
+
+
+def next_request_id() -> str:
+    """Return a random 128-bit hex id, drawing entropy in batches instead of per request."""
+
+    try:
+        return _request_id_pool.popleft()
+    except IndexError:
+        raw = os.urandom(16 * _REQUEST_ID_BATCH_SIZE).hex()
+        _request_id_pool.extend(raw[offset : offset + 32] for offset in range(32, len(raw), 32))
+        return raw[:32]
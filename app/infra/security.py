@@ -1,9 +1,10 @@
 import asyncio
 import logging
 import time
-from collections import defaultdict, deque
-from ipaddress import ip_address, ip_network
-from typing import Deque, Dict, Protocol
+from collections import OrderedDict
+from functools import lru_cache
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from typing import Dict, Protocol
 
 import redis.asyncio as redis
 from redis.exceptions import RedisError, ResponseError
@@ -17,38 +18,48 @@ logger = logging.getLogger("app.rate_limit")
 class RateLimiter(Protocol):
     async def allow(self, key: str) -> bool: ...
 
+    def try_allow_fast(self, key: str) -> bool | None: ...
+
+    async def preload(self) -> None: ...
+
     async def reset(self) -> None: ...
 
     async def close(self) -> None: ...
 
 
 class InMemoryRateLimiter:
+    """Per-key token bucket holding ``requests_per_minute`` tokens, refilled lazily on access."""
+
     def __init__(self, requests_per_minute: int, cleanup_minutes: int = 10) -> None:
         self.requests_per_minute = requests_per_minute
         self.cleanup_minutes = cleanup_minutes
-        self._requests: Dict[str, Deque[float]] = defaultdict(deque)
-        self._last_seen: Dict[str, float] = {}
+        # key -> (tokens, last_refill); no per-request timestamps are retained.
+        self._buckets: Dict[str, tuple[float, float]] = {}
         self._last_prune: float = 0.0
         self._lock = asyncio.Lock()
 
     async def allow(self, key: str) -> bool:
         async with self._lock:
-            now = time.time()
-            self._maybe_prune(now)
-            window_start = now - 60
-            timestamps = self._requests[key]
-            while timestamps and timestamps[0] < window_start:
-                timestamps.popleft()
-            if len(timestamps) >= self.requests_per_minute:
-                self._last_seen[key] = now
-                return False
-            timestamps.append(now)
-            self._last_seen[key] = now
+            return self.try_allow_fast(key)
+
+    def try_allow_fast(self, key: str) -> bool | None:
+        # Pure in-process bookkeeping with no awaits, so the decision is always final.
+        now = time.monotonic()
+        self._maybe_prune(now)
+        capacity = float(self.requests_per_minute)
+        tokens, last_refill = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - last_refill) * capacity / 60)
+        if tokens >= 1.0:
+            self._buckets[key] = (tokens - 1.0, now)
             return True
+        self._buckets[key] = (tokens, now)
+        return False
+
+    async def preload(self) -> None:
+        return None
 
     async def reset(self) -> None:
-        self._requests.clear()
-        self._last_seen.clear()
+        self._buckets.clear()
         self._last_prune = 0.0
 
     async def close(self) -> None:
@@ -57,35 +68,33 @@ class InMemoryRateLimiter:
     def _maybe_prune(self, now: float) -> None:
         if now - self._last_prune < 60:
             return
-        expire_before = now - (self.cleanup_minutes * 60)
-        for key in list(self._requests.keys()):
-            timestamps = self._requests[key]
-            if not timestamps or self._last_seen.get(key, 0.0) < expire_before:
-                self._requests.pop(key, None)
-                self._last_seen.pop(key, None)
+        # Idle for at least a full minute means the bucket is back at capacity, so dropping
+        # it is indistinguishable from keeping it.
+        expire_before = now - max(self.cleanup_minutes * 60, 60)
+        for key in [key for key, (_, last_refill) in self._buckets.items() if last_refill < expire_before]:
+            del self._buckets[key]
         self._last_prune = now
 
 
 RATE_LIMIT_LUA = r'''
-local limit = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[1])
 local window_ms = tonumber(ARGV[2])
 local ttl_seconds = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4] or '1')
 
 local time = redis.call('TIME')
 local now_ms = (time[1] * 1000) + math.floor(time[2] / 1000)
 
-redis.call('ZREMRANGEBYSCORE', KEYS[1], 0, now_ms - window_ms)
-local current = redis.call('ZCARD', KEYS[1])
-if current >= limit then
-  return 0
-end
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local last_ms = tonumber(bucket[2]) or now_ms
+tokens = math.min(capacity, tokens + math.max(0, now_ms - last_ms) * capacity / window_ms)
 
-local seq = redis.call('INCR', KEYS[2])
-local member = tostring(now_ms) .. ':' .. tostring(seq)
-redis.call('ZADD', KEYS[1], now_ms, member)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now_ms))
 redis.call('EXPIRE', KEYS[1], ttl_seconds)
-redis.call('EXPIRE', KEYS[2], ttl_seconds)
-return 1
+return granted
 '''
 
 
@@ -98,6 +107,9 @@ class RedisRateLimiter:
         redis_client: redis.Redis | None = None,
         fail_open_seconds: int = 300,
         health_probe_seconds: float = 5.0,
+        local_tokens: int = 0,
+        local_ttl_seconds: float = 1.0,
+        local_capacity: int = 10_000,
     ) -> None:
         self.requests_per_minute = requests_per_minute
         self.cleanup_seconds = max(int(cleanup_minutes * 60), 60)
@@ -113,22 +125,47 @@ class RedisRateLimiter:
         self._last_probe: float = 0.0
         self._fail_open_lock = asyncio.Lock()
 
+        # Optional per-process token prefetch: each Redis round trip may reserve up to
+        # ``local_tokens`` requests for a client, spent locally for ``local_ttl_seconds``.
+        self.local_tokens = max(1, local_tokens)
+        self.local_ttl_seconds = max(0.0, local_ttl_seconds)
+        self.local_capacity = max(1, local_capacity)
+        self._local: OrderedDict[str, tuple[int, float]] = OrderedDict()
+
     async def allow(self, key: str) -> bool:
         now = time.monotonic()
         if self._fail_open_until > now:
             return await self._allow_with_fail_open(key, now)
+        if self.local_tokens > 1 and self._take_local_token(key, now):
+            return True
         try:
-            set_key = self._key(key)
-            seq_key = self._seq_key(key)
-
-            allowed = await self._eval_script(set_key, seq_key)
-            return bool(allowed)
+            granted = int(await self._eval_script(self._key(key), self.local_tokens))
+            if granted > 1:
+                self._store_local_tokens(key, granted - 1, now)
+            return granted > 0
         except RedisError:
             await self._enter_fail_open(now)
             logger.warning("redis rate limiter unavailable; using in-memory fallback")
             return await self._allow_with_fail_open(key, now)
 
+    def try_allow_fast(self, key: str) -> bool | None:
+        """Spend a prefetched local token without touching Redis; ``None`` means ask Redis."""
+
+        now = time.monotonic()
+        if self._fail_open_until > now or self.local_tokens <= 1:
+            return None
+        return True if self._take_local_token(key, now) else None
+
+    async def preload(self) -> None:
+        """Register the Lua script up front so the first request skips the SCRIPT LOAD round trip."""
+
+        try:
+            self._script_sha = await self.redis.script_load(RATE_LIMIT_LUA)
+        except RedisError:
+            logger.warning("redis rate limiter script preload failed")
+
     async def reset(self) -> None:
+        self._local.clear()
         try:
             cursor = 0
             while True:
@@ -169,24 +206,43 @@ class RedisRateLimiter:
                 return await self.allow(key)
         return await self._fallback.allow(key)
 
-    def _key(self, key: str) -> str:
-        return f"rate-limit:{key}"
+    def _take_local_token(self, key: str, now: float) -> bool:
+        entry = self._local.get(key)
+        if entry is None:
+            return False
+        tokens, expires_at = entry
+        if expires_at <= now:
+            del self._local[key]
+            return False
+        if tokens <= 1:
+            del self._local[key]
+        else:
+            self._local[key] = (tokens - 1, expires_at)
+            self._local.move_to_end(key)
+        return True
+
+    def _store_local_tokens(self, key: str, tokens: int, now: float) -> None:
+        self._local[key] = (tokens, now + self.local_ttl_seconds)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_capacity:
+            self._local.popitem(last=False)
 
-    def _seq_key(self, key: str) -> str:
-        return f"rate-limit:{key}:seq"
+    def _key(self, key: str) -> str:
+        # Distinct from the old sorted-set keys so a rolling deploy never hits WRONGTYPE.
+        return f"rate-limit:bucket:{key}"
 
-    async def _eval_script(self, set_key: str, seq_key: str) -> int:
+    async def _eval_script(self, bucket_key: str, requested: int = 1) -> int:
         if not self._script_sha:
             self._script_sha = await self.redis.script_load(RATE_LIMIT_LUA)
         try:
             return await self.redis.evalsha(
                 self._script_sha,
-                2,
-                set_key,
-                seq_key,
+                1,
+                bucket_key,
                 self.requests_per_minute,
                 self.window_ms,
                 self.ttl_seconds,
+                requested,
             )
         except ResponseError as exc:
             if "NOSCRIPT" not in str(exc):
@@ -194,12 +250,12 @@ class RedisRateLimiter:
 
         result = await self.redis.eval(
             RATE_LIMIT_LUA,
-            2,
-            set_key,
-            seq_key,
+            1,
+            bucket_key,
             self.requests_per_minute,
             self.window_ms,
             self.ttl_seconds,
+            requested,
         )
         try:
             self._script_sha = await self.redis.script_load(RATE_LIMIT_LUA)
@@ -217,6 +273,8 @@ def create_rate_limiter(app_settings, requests_per_minute: int | None = None) ->
             cleanup_minutes=app_settings.rate_limit_cleanup_minutes,
             fail_open_seconds=getattr(app_settings, "rate_limit_fail_open_seconds", 300),
             health_probe_seconds=getattr(app_settings, "rate_limit_redis_probe_seconds", 5.0),
+            local_tokens=getattr(app_settings, "rate_limit_local_tokens", 0),
+            local_ttl_seconds=getattr(app_settings, "rate_limit_local_ttl_seconds", 1.0),
         )
     return InMemoryRateLimiter(
         limit,
@@ -224,11 +282,31 @@ def create_rate_limiter(app_settings, requests_per_minute: int | None = None) ->
     )
 
 
+_CLIENT_KEY_SCOPE_KEY = "app.client_key"
+
+
 def resolve_client_key(
     request: Request,
     trust_proxy_headers: bool,
     trusted_proxy_ips: list[str],
     trusted_proxy_cidrs: list[str],
+) -> str:
+    # Rate limiting, admin safety and client routes all resolve the key for the same request;
+    # memoize it on the scope so X-Forwarded-For and the proxy lists are only checked once.
+    config = (trust_proxy_headers, tuple(trusted_proxy_ips), tuple(trusted_proxy_cidrs))
+    cached = request.scope.get(_CLIENT_KEY_SCOPE_KEY)
+    if cached is not None and cached[0] == config:
+        return cached[1]
+    client_key = _resolve_client_key(request, *config)
+    request.scope[_CLIENT_KEY_SCOPE_KEY] = (config, client_key)
+    return client_key
+
+
+def _resolve_client_key(
+    request: Request,
+    trust_proxy_headers: bool,
+    trusted_proxy_ips: tuple[str, ...],
+    trusted_proxy_cidrs: tuple[str, ...],
 ) -> str:
     client_host = request.client.host if request.client else "unknown"
     if not trust_proxy_headers or not _is_trusted_proxy(client_host, trusted_proxy_ips, trusted_proxy_cidrs):
@@ -244,17 +322,25 @@ def resolve_client_key(
     return first_ip
 
 
-def _is_trusted_proxy(client_host: str, trusted_ips: list[str], trusted_cidrs: list[str]) -> bool:
+@lru_cache(maxsize=32)
+def _trusted_networks(trusted_cidrs: tuple[str, ...]) -> tuple[IPv4Network | IPv6Network, ...]:
+    networks = []
+    for cidr in trusted_cidrs:
+        try:
+            networks.append(ip_network(cidr, strict=False))
+        except ValueError:
+            continue
+    return tuple(networks)
+
+
+def _is_trusted_proxy(client_host: str, trusted_ips: tuple[str, ...], trusted_cidrs: tuple[str, ...]) -> bool:
     if client_host in trusted_ips:
         return True
+    networks = _trusted_networks(trusted_cidrs)
+    if not networks:
+        return False
     try:
         client_ip = ip_address(client_host)
     except ValueError:
         return False
-    for cidr in trusted_cidrs:
-        try:
-            if client_ip in ip_network(cidr):
-                return True
-        except ValueError:
-            continue
-    return False
+    return any(client_ip in network for network in networks)
@@ -33,6 +33,9 @@ def _new_backend() -> StorageBackend:
             read_timeout=settings.s3_read_timeout_seconds,
             max_attempts=settings.s3_max_attempts,
             max_payload_bytes=settings.order_photo_max_bytes,
+            circuit_failure_threshold=settings.s3_circuit_failure_threshold,
+            circuit_recovery_seconds=settings.s3_circuit_recovery_seconds,
+            circuit_window_seconds=settings.s3_circuit_window_seconds,
         )
     if backend in {"r2", "cloudflare_r2"}:
         if not settings.r2_bucket:
@@ -49,6 +52,9 @@ def _new_backend() -> StorageBackend:
             read_timeout=settings.s3_read_timeout_seconds,
             max_attempts=settings.s3_max_attempts,
             max_payload_bytes=settings.order_photo_max_bytes,
+            circuit_failure_threshold=settings.s3_circuit_failure_threshold,
+            circuit_recovery_seconds=settings.s3_circuit_recovery_seconds,
+            circuit_window_seconds=settings.s3_circuit_window_seconds,
             public_base_url=settings.r2_public_base_url,
         )
     if backend == "cloudflare_images":
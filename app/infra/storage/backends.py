@@ -1,13 +1,18 @@
+from __future__ import annotations
+
 import asyncio
+import bisect
 import hashlib
 import hmac
+import re
 import shutil
 import time
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, AsyncIterator, Optional
-from urllib.parse import parse_qsl, urlparse
+from typing import Any, AsyncIterator, Callable, Iterable, Optional, TypeVar
+from urllib.parse import urlparse
 
 import boto3
 from botocore.client import Config
@@ -17,6 +22,11 @@ from fastapi import HTTPException, status
 from app.settings import settings
 from app.shared.circuit_breaker import CircuitBreaker
 
+T = TypeVar("T")
+
+_SIGNED_URL_EXP_RE = re.compile(r"[?&]exp=([^&#]+)")
+_SIGNED_URL_SIG_RE = re.compile(r"[?&]sig=([^&#]+)")
+
 
 @dataclass
 class StoredObject:
@@ -52,6 +62,19 @@ class StorageBackend(ABC):
         """Alias for read() for backward compatibility."""
         return await self.read(key=key)
 
+    async def read_many(self, *, keys: Iterable[str], concurrency: int = 16) -> list[bytes]:
+        """Return the payloads for ``keys`` in order; backends with network reads may overlap them."""
+
+        return [await self.read(key=key) for key in keys]
+
+    async def iter_prefix(
+        self, *, prefix: str = "", prefetch: int = 8
+    ) -> AsyncIterator[tuple[str, bytes]]:
+        """Yield ``(key, payload)`` for every object under ``prefix`` in listing order."""
+
+        for key in await self.list(prefix=prefix):
+            yield key, await self.read(key=key)
+
     @abstractmethod
     async def delete(self, *, key: str) -> None:
         """Delete an object if it exists."""
@@ -215,12 +238,15 @@ class LocalStorageBackend(StorageBackend):
         return f"{resource_url}{separator}exp={expires_at}&sig={signature}"
 
     def validate_signed_get_url(self, *, key: str, url: str) -> bool:
-        parsed = urlparse(url)
-        params = dict(parse_qsl(parsed.query))
-        sig = params.get("sig")
-        exp_raw = params.get("exp")
-        if not sig or not exp_raw:
+        query_start = url.find("?")
+        if query_start < 0:
+            return False
+        sig_match = _SIGNED_URL_SIG_RE.search(url, query_start)
+        exp_match = _SIGNED_URL_EXP_RE.search(url, query_start)
+        if not sig_match or not exp_match:
             return False
+        sig = sig_match.group(1)
+        exp_raw = exp_match.group(1)
         try:
             expires_at = int(exp_raw)
         except ValueError:
@@ -284,11 +310,17 @@ class S3StorageBackend(StorageBackend):
         self.public_base_url = public_base_url.rstrip("/") if public_base_url else None
         self._breaker: CircuitBreaker | None = None
         if enable_circuit_breaker:
+            if circuit_failure_threshold is None:
+                circuit_failure_threshold = settings.s3_circuit_failure_threshold
+            if circuit_recovery_seconds is None:
+                circuit_recovery_seconds = settings.s3_circuit_recovery_seconds
+            if circuit_window_seconds is None:
+                circuit_window_seconds = settings.s3_circuit_window_seconds
             self._breaker = CircuitBreaker(
                 name="s3",
-                failure_threshold=circuit_failure_threshold or settings.s3_circuit_failure_threshold,
-                recovery_time=circuit_recovery_seconds or settings.s3_circuit_recovery_seconds,
-                window_seconds=circuit_window_seconds or settings.s3_circuit_window_seconds,
+                failure_threshold=circuit_failure_threshold,
+                recovery_time=circuit_recovery_seconds,
+                window_seconds=circuit_window_seconds,
             )
 
     async def put(
@@ -299,24 +331,25 @@ class S3StorageBackend(StorageBackend):
             buffer.extend(chunk)
             if self.max_payload_bytes and len(buffer) > self.max_payload_bytes:
                 raise ValueError("Payload exceeds configured upload limit")
-        data = bytes(buffer)
+        size = len(buffer)
 
         def _upload() -> None:
-            self.client.put_object(Bucket=self.bucket, Key=key, Body=data, ContentType=content_type)
-        await self._run_with_circuit(lambda: asyncio.to_thread(_upload))
-        return StoredObject(key=key, size=len(data), content_type=content_type)
+            # botocore accepts bytearray blobs directly; avoid copying the payload into bytes.
+            self.client.put_object(Bucket=self.bucket, Key=key, Body=buffer, ContentType=content_type)
+        await self._run_in_thread(_upload)
+        return StoredObject(key=key, size=size, content_type=content_type)
 
     async def read(self, *, key: str) -> bytes:
         def _download() -> bytes:
             response = self.client.get_object(Bucket=self.bucket, Key=key)
             return response["Body"].read()
 
-        return await self._run_with_circuit(lambda: asyncio.to_thread(_download))
+        return await self._run_in_thread(_download)
 
     async def delete(self, *, key: str) -> None:
         def _delete() -> None:
             self.client.delete_object(Bucket=self.bucket, Key=key)
-        await self._run_with_circuit(lambda: asyncio.to_thread(_delete))
+        await self._run_in_thread(_delete)
 
     async def list(self, *, prefix: str = "") -> list[str]:
         keys: list[str] = []
@@ -326,9 +359,41 @@ class S3StorageBackend(StorageBackend):
             for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
                 for item in page.get("Contents", []):
                     keys.append(item["Key"])
-        await self._run_with_circuit(lambda: asyncio.to_thread(_list))
+        await self._run_in_thread(_list)
         return keys
 
+    async def read_many(self, *, keys: Iterable[str], concurrency: int = 16) -> list[bytes]:
+        """Read several objects with at most ``concurrency`` GETs in flight."""
+
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def _read_one(key: str) -> bytes:
+            async with semaphore:
+                return await self.read(key=key)
+
+        return list(await asyncio.gather(*(_read_one(key) for key in keys)))
+
+    async def iter_prefix(
+        self, *, prefix: str = "", prefetch: int = 8
+    ) -> AsyncIterator[tuple[str, bytes]]:
+        """Yield ``(key, payload)`` in listing order, fetching up to ``prefetch`` objects ahead."""
+
+        keys = await self.list(prefix=prefix)
+        window = max(1, prefetch)
+        pending: deque[tuple[str, asyncio.Task[bytes]]] = deque()
+        try:
+            for key in keys:
+                pending.append((key, asyncio.create_task(self.read(key=key))))
+                if len(pending) >= window:
+                    ready_key, task = pending.popleft()
+                    yield ready_key, await task
+            while pending:
+                ready_key, task = pending.popleft()
+                yield ready_key, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
+
     async def generate_signed_get_url(
         self,
         *,
@@ -344,20 +409,18 @@ class S3StorageBackend(StorageBackend):
                 ExpiresIn=expires_in,
             )
 
-        return await self._run_with_circuit(lambda: asyncio.to_thread(_sign))
+        return await self._run_in_thread(_sign)
 
-    async def _run_with_circuit(self, fn):
+    async def _run_in_thread(self, fn: Callable[[], T]) -> T:
         if self._breaker is None:
-            result = fn()
-            if asyncio.iscoroutine(result):
-                return await result
-            return result
-        return await self._breaker.call(fn)
+            return await asyncio.to_thread(fn)
+        return await self._breaker.call_async(asyncio.to_thread, fn)
 
 
 class InMemoryStorageBackend(StorageBackend):
     def __init__(self) -> None:
         self._objects: dict[str, tuple[bytes, str]] = {}
+        self._keys: list[str] = []
 
     async def put(
         self, *, key: str, body: AsyncIterator[bytes], content_type: str
@@ -366,6 +429,8 @@ class InMemoryStorageBackend(StorageBackend):
         async for chunk in body:
             data.extend(chunk)
         payload = bytes(data)
+        if key not in self._objects:
+            bisect.insort(self._keys, key)
         self._objects[key] = (payload, content_type)
         return StoredObject(key=key, size=len(payload), content_type=content_type)
 
@@ -374,10 +439,15 @@ class InMemoryStorageBackend(StorageBackend):
         return payload
 
     async def delete(self, *, key: str) -> None:
-        self._objects.pop(key, None)
+        if self._objects.pop(key, None) is not None:
+            del self._keys[bisect.bisect_left(self._keys, key)]
 
     async def list(self, *, prefix: str = "") -> list[str]:
-        return [k for k in self._objects if k.startswith(prefix)]
+        start = bisect.bisect_left(self._keys, prefix)
+        end = start
+        while end < len(self._keys) and self._keys[end].startswith(prefix):
+            end += 1
+        return self._keys[start:end]
 
     async def generate_signed_get_url(
         self,
@@ -1,10 +1,11 @@
 import argparse
 import asyncio
+import functools
 import logging
 from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
 
-from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.infra.db import get_session_factory
 from app.infra.email import EmailAdapter, resolve_email_adapter
@@ -13,31 +14,44 @@ from app.infra.metrics import configure_metrics, metrics
 from app.jobs.heartbeat import record_heartbeat
 from app.jobs import accounting_export, dlq_auto_replay, email_jobs, outbox, storage_janitor
 from app.infra.storage import new_storage_backend
+from app.infra.storage.backends import StorageBackend
 from app.domain.ops.db_models import JobHeartbeat
 from app.settings import settings
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
-_ADAPTER: EmailAdapter | None = None
-_STORAGE: object | None = None
-
 
 async def _run_job(
     name: str,
-    session_factory: async_sessionmaker,
+    session: AsyncSession,
     runner: Callable[[object], Awaitable[dict[str, int]]],
 ) -> None:
     try:
-        async with session_factory() as session:
-            result = await runner(session)
+        result = await runner(session)
         logger.info("job_complete", extra={"extra": {"job": name, **result}})
         _record_email_job_metrics(name, result)
-        await _record_job_result(session_factory, name, success=True)
+        await _record_job_result(session, name, success=True)
     finally:
         clear_log_context()
 
 
+async def _run_job_isolated(
+    name: str,
+    session_factory: async_sessionmaker,
+    runner: Callable[[object], Awaitable[dict[str, int]]],
+    semaphore: asyncio.Semaphore,
+) -> None:
+    async with semaphore, session_factory() as session:
+        try:
+            await _run_job(name, session, runner)
+        except Exception as exc:  # noqa: BLE001
+            await session.rollback()
+            metrics.record_email_job(name, "error")
+            logger.warning("job_failed", extra={"extra": {"job": name, "reason": type(exc).__name__}})
+            await _record_job_result(session, name, success=False, error_reason=type(exc).__name__)
+
+
 def _record_email_job_metrics(job: str, result: dict[str, int]) -> None:
     sent_total = result.get("sent", 0) + result.get("overdue", 0)
     skipped_total = result.get("skipped", 0)
@@ -48,79 +62,111 @@ def _record_email_job_metrics(job: str, result: dict[str, int]) -> None:
 
 
 async def _record_job_result(
-    session_factory: async_sessionmaker, job: str, *, success: bool, error_reason: str | None = None
+    session: AsyncSession, job: str, *, success: bool, error_reason: str | None = None
 ) -> None:
     now = datetime.now(tz=timezone.utc)
-    async with session_factory() as session:
-        record = await session.get(JobHeartbeat, job)
-        if record is None:
-            record = JobHeartbeat(
-                name=job,
-                last_heartbeat=now,
-                last_success_at=now if success else None,
-                consecutive_failures=0,
-                last_error=None,
-                last_error_at=None,
-                updated_at=now,
-            )
-            session.add(record)
+    record = await session.get(JobHeartbeat, job)
+    if record is None:
+        record = JobHeartbeat(
+            name=job,
+            last_heartbeat=now,
+            last_success_at=now if success else None,
+            consecutive_failures=0,
+            last_error=None,
+            last_error_at=None,
+            updated_at=now,
+        )
+        session.add(record)
+    else:
+        record.last_heartbeat = now
+        if success:
+            record.last_success_at = now
+            record.consecutive_failures = 0
+            record.last_error = None
+            record.last_error_at = None
         else:
-            record.last_heartbeat = now
-            if success:
-                record.last_success_at = now
-                record.consecutive_failures = 0
-                record.last_error = None
-                record.last_error_at = None
-            else:
-                record.consecutive_failures = (record.consecutive_failures or 0) + 1
-                record.last_error = error_reason or record.last_error
-                record.last_error_at = now
-        await session.commit()
+            record.consecutive_failures = (record.consecutive_failures or 0) + 1
+            record.last_error = error_reason or record.last_error
+            record.last_error_at = now
+    await session.commit()
     if success:
         metrics.record_job_success(job, now.timestamp())
     else:
         metrics.record_job_error(job, error_reason or "unknown")
 
 
-def _job_runner(name: str, base_url: str | None = None) -> Callable:
-    if name == "booking-reminders":
-        return lambda session: email_jobs.run_booking_reminders(session, _ADAPTER)
-    if name == "invoice-reminders":
-        return lambda session: email_jobs.run_invoice_notifications(session, _ADAPTER, base_url=base_url)
-    if name == "nps-send":
-        return lambda session: email_jobs.run_nps_sends(session, _ADAPTER, base_url=base_url)
-    if name == "email-dlq":
-        return lambda session: email_jobs.run_email_dlq(session, _ADAPTER)
-    if name == "outbox-delivery":
-        return lambda session: outbox.run_outbox_delivery(session, _ADAPTER)
-    if name == "dlq-auto-replay":
-        return lambda session: dlq_auto_replay.run_dlq_auto_replay(
-            session,
-            _ADAPTER,
-            org_id=settings.default_org_id,
-            export_transport=None,
-            export_resolver=None,
-        )
-    if name == "accounting-export":
-        return lambda session: accounting_export.run_accounting_export(
-            session, org_id=settings.default_org_id, export_mode=settings.export_mode
+JOBS: dict[str, tuple[Callable[..., Awaitable[dict[str, int]]], tuple[str, ...]]] = {
+    "booking-reminders": (email_jobs.run_booking_reminders, ("adapter",)),
+    "invoice-reminders": (email_jobs.run_invoice_notifications, ("adapter", "base_url")),
+    "nps-send": (email_jobs.run_nps_sends, ("adapter", "base_url")),
+    "email-dlq": (email_jobs.run_email_dlq, ("adapter",)),
+    "outbox-delivery": (outbox.run_outbox_delivery, ("adapter",)),
+    "dlq-auto-replay": (
+        dlq_auto_replay.run_dlq_auto_replay,
+        ("adapter", "org_id", "export_transport", "export_resolver"),
+    ),
+    "accounting-export": (accounting_export.run_accounting_export, ("org_id", "export_mode")),
+    "storage-janitor": (storage_janitor.run_storage_janitor, ("storage",)),
+}
+
+
+# The reminder and NPS jobs only insert new EmailEvent/outbox rows, reserved under dedupe keys that
+# include their own email type, so they may overlap. The DLQ, outbox and export jobs read and
+# update existing OutboxEvent/ExportEvent rows without row locks and always run one at a time.
+CONCURRENT_JOBS = frozenset({"booking-reminders", "invoice-reminders", "nps-send"})
+
+
+def _job_concurrency(requested: int) -> int:
+    # Each running job holds a pooled connection; never ask for more than the pool can hand out.
+    pool_capacity = max(settings.database_pool_size + settings.database_max_overflow, 1)
+    concurrency = min(max(requested, 1), pool_capacity)
+    if concurrency < requested:
+        logger.warning(
+            "job_concurrency_clamped",
+            extra={"extra": {"requested": requested, "pool_capacity": pool_capacity}},
         )
-    if name == "storage-janitor":
-        return lambda session: storage_janitor.run_storage_janitor(session, _STORAGE)
-    raise ValueError(f"unknown_job:{name}")
+    return concurrency
+
+
+def _job_runner(
+    name: str,
+    *,
+    adapter: EmailAdapter | None = None,
+    storage: StorageBackend | None = None,
+    base_url: str | None = None,
+) -> Callable:
+    try:
+        fn, params = JOBS[name]
+    except KeyError:
+        raise ValueError(f"unknown_job:{name}") from None
+    available = {
+        "adapter": adapter,
+        "storage": storage,
+        "base_url": base_url,
+        "org_id": settings.default_org_id,
+        "export_mode": settings.export_mode,
+        "export_transport": None,
+        "export_resolver": None,
+    }
+    return functools.partial(fn, **{param: available[param] for param in params})
 
 
 async def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(description="Run scheduled jobs")
-    parser.add_argument("--job", action="append", dest="jobs", help="Job name to run")
+    parser.add_argument("--job", action="append", dest="jobs", choices=sorted(JOBS), help="Job name to run")
     parser.add_argument("--interval", type=int, default=60, help="Seconds between loops when not using --once")
     parser.add_argument("--base-url", dest="base_url", default=None, help="Public base URL for links")
     parser.add_argument("--once", action="store_true", help="Run jobs once and exit")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum number of jobs running at the same time (capped at the DB pool size plus overflow)",
+    )
     args = parser.parse_args(argv)
 
-    global _ADAPTER, _STORAGE
-    _ADAPTER = resolve_email_adapter(settings)
-    _STORAGE = new_storage_backend()
+    adapter = resolve_email_adapter(settings)
+    storage = new_storage_backend()
     configure_metrics(settings.metrics_enabled)
     session_factory = get_session_factory()
 
@@ -133,23 +179,48 @@ async def main(argv: list[str] | None = None) -> None:
         "dlq-auto-replay",
         "storage-janitor",
     ]
-    runners = [_job_runner(name, base_url=args.base_url) for name in job_names]
+    runners = [
+        (name, _job_runner(name, adapter=adapter, storage=storage, base_url=args.base_url))
+        for name in job_names
+    ]
+    concurrent_runners = [(name, runner) for name, runner in runners if name in CONCURRENT_JOBS]
+    sequential_runners = [(name, runner) for name, runner in runners if name not in CONCURRENT_JOBS]
+
+    semaphore = asyncio.Semaphore(_job_concurrency(args.concurrency))
 
     while True:
-        for name, runner in zip(job_names, runners):
+        # Each job runs in its own session; only the CONCURRENT_JOBS group overlaps on I/O.
+        results = list(
+            await asyncio.gather(
+                *(
+                    _run_job_isolated(name, session_factory, runner, semaphore)
+                    for name, runner in concurrent_runners
+                ),
+                return_exceptions=True,
+            )
+        )
+        for name, runner in sequential_runners:
             try:
-                await _run_job(name, session_factory, runner)
+                await _run_job_isolated(name, session_factory, runner, semaphore)
             except Exception as exc:  # noqa: BLE001
-                metrics.record_email_job(name, "error")
-                logger.warning("job_failed", extra={"extra": {"job": name, "reason": type(exc).__name__}})
-                await _record_job_result(
-                    session_factory, name, success=False, error_reason=type(exc).__name__
-                )
+                results.append(exc)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         await record_heartbeat(session_factory, name="jobs-runner")
         if args.once:
             break
         await asyncio.sleep(max(args.interval, 1))
 
 
+def _install_event_loop_policy() -> None:
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
 if __name__ == "__main__":
+    _install_event_loop_policy()
     asyncio.run(main())
@@ -2,17 +2,15 @@ import logging
 import os
 import sys
 import time
-import uuid
 from contextlib import asynccontextmanager
-from typing import Callable, Iterable
 
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from app.api.admin_auth import AdminAccessMiddleware, AdminAuditMiddleware
 from app.api.routes_admin import router as admin_router
 from app.api.break_glass import router as break_glass_router
 from app.api.routes_queues import router as queues_router
@@ -21,6 +19,7 @@ from app.api.routes_bookings import router as bookings_router
 from app.api.routes_chat import router as chat_router
 from app.api.routes_estimate import router as estimate_router
 from app.api.routes_bot import router as bot_router
+from app.api.access_control import AccessControlMiddleware
 from app.api.admin_safety import AdminSafetyMiddleware
 from app.api.routes_checklists import router as checklists_router
 from app.api.routes_health import router as health_router
@@ -32,15 +31,15 @@ from app.api.routes_ui_lang import router as ui_lang_router
 from app.api.routes_worker import router as worker_router
 from app.api.routes_auth import router as auth_router
 from app.api.routes_iam import router as iam_router
-from app.api.worker_auth import WorkerAccessMiddleware
 from app.api.routes_public import router as public_router
 from app.api.routes_leads import router as leads_router
 from app.api.routes_billing import router as billing_router
 from app.api.problem_details import (
     PROBLEM_TYPE_DOMAIN,
-    PROBLEM_TYPE_RATE_LIMIT,
     PROBLEM_TYPE_SERVER,
     PROBLEM_TYPE_VALIDATION,
+    RATE_LIMIT_PROBLEM,
+    SERVER_ERROR_PROBLEM,
     problem_details,
 )
 from app.api.mfa import AdminMfaMiddleware
@@ -50,11 +49,13 @@ from app.infra.db import get_session_factory
 from app.infra.email import EmailAdapter
 from app.infra.logging import clear_log_context, configure_logging, update_log_context
 from app.infra.metrics import configure_metrics, metrics
+from app.infra.request_id import next_request_id
 from app.infra.security import RateLimiter, resolve_client_key
 from app.settings import settings
 from app.services import build_app_services
 
 logger = logging.getLogger(__name__)
+request_logger = logging.getLogger("app.request")
 
 
 def _resolve_log_identity(request: Request) -> dict[str, str]:
@@ -100,122 +101,203 @@ def _resolve_log_identity(request: Request) -> dict[str, str]:
     return context
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable):
-        request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
-        request.state.request_id = request_id
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = request_id
-        return response
-
-
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable):
-        logger = logging.getLogger("app.request")
-        start = time.time()
-        request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
-        if not request_id:
-            request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
-        update_log_context(request_id=request_id, method=request.method, path=request.url.path)
+class EdgeMiddleware:
+    """Request id, rate limiting and access logging in one ASGI pass with a single send wrapper."""
+
+    # Probes and scrapers hit these every few seconds; they are never rate limited.
+    RATE_LIMIT_EXEMPT_PATHS = frozenset({"/healthz", "/readyz", "/metrics"})
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter, app_settings) -> None:
+        self.app = app
+        self.limiter = limiter
+        self.app_settings = app_settings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        response = None
+        request = Request(scope)
+        request_id = request.headers.get("X-Request-ID") or next_request_id()
+        request.state.request_id = request_id
         status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
+
+        if scope["path"] not in self.RATE_LIMIT_EXEMPT_PATHS and not await self._allow(request):
+            response = RATE_LIMIT_PROBLEM.response(request)
+            await response(scope, receive, send_wrapper)
+            return
+
+        start = time.perf_counter_ns()
+        update_log_context(request_id=request_id, method=request.method, path=scope["path"])
         try:
-            response = await call_next(request)
-            status_code = response.status_code
-            return response
+            await self.app(scope, receive, send_wrapper)
         finally:
-            identity_context = _resolve_log_identity(request)
-            update_log_context(status_code=status_code, **identity_context)
-            latency_ms = int((time.time() - start) * 1000)
-            logger.info("request", extra={"latency_ms": latency_ms})
-            if response is not None:
-                response.headers.setdefault("X-Request-ID", request_id)
+            if request_logger.isEnabledFor(logging.INFO):
+                # The identity dict doubles as the record's extra payload; the context is cleared below,
+                # so there is no need to merge these fields into it first.
+                log_extra = _resolve_log_identity(request)
+                log_extra["status_code"] = status_code
+                log_extra["latency_ms"] = (time.perf_counter_ns() - start) // 1_000_000
+                request_logger.info("request", extra=log_extra)
             clear_log_context()
 
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next: Callable):
-        response = await call_next(request)
-        response.headers.setdefault("X-Content-Type-Options", "nosniff")
-        response.headers.setdefault("X-Frame-Options", "DENY")
-        response.headers.setdefault("Referrer-Policy", "no-referrer")
-        response.headers.setdefault(
-            "Content-Security-Policy",
-            "default-src 'self'; img-src 'self' data:; style-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'",
+    async def _allow(self, request: Request) -> bool:
+        client = resolve_client_key(
+            request,
+            trust_proxy_headers=self.app_settings.trust_proxy_headers,
+            trusted_proxy_ips=self.app_settings.trusted_proxy_ips,
+            trusted_proxy_cidrs=self.app_settings.trusted_proxy_cidrs,
         )
-        return response
+        allowed = self.limiter.try_allow_fast(client)
+        if allowed is None:
+            allowed = await self.limiter.allow(client)
+        return allowed
+
+
+_SECURITY_HEADERS: tuple[tuple[bytes, bytes], ...] = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"referrer-policy", b"no-referrer"),
+    (
+        b"content-security-policy",
+        b"default-src 'self'; img-src 'self' data:; style-src 'self' 'unsafe-inline'; script-src 'self' 'unsafe-inline'",
+    ),
+)
+
 
+class SecurityHeadersMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class MetricsMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, metrics_client) -> None:
-        super().__init__(app)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_security_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                present = {name.lower() for name, _ in headers}
+                missing = [header for header in _SECURITY_HEADERS if header[0] not in present]
+                if missing:
+                    message["headers"] = [*headers, *missing]
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp, metrics_client) -> None:
+        self.app = app
         self.metrics = metrics_client
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        path_label = "unmatched"
-        start = time.perf_counter()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        start = time.perf_counter_ns()
         status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         try:
-            response = await call_next(request)
-            status_code = response.status_code
+            await self.app(scope, receive, send_wrapper)
         except Exception:
-            route = request.scope.get("route")
-            path_label = getattr(route, "path", path_label)
-            self.metrics.record_http_5xx(request.method, path_label)
+            self.metrics.record_http_5xx(method, _route_path_label(scope))
             raise
         finally:
-            route = request.scope.get("route")
-            path_label = getattr(route, "path", path_label)
-            duration = time.perf_counter() - start
-            self.metrics.record_http_latency(request.method, path_label, status_code, duration)
+            duration = (time.perf_counter_ns() - start) / 1_000_000_000
+            self.metrics.record_http_latency(method, _route_path_label(scope), status_code, duration)
         if status_code >= 500:
-            self.metrics.record_http_5xx(request.method, path_label)
-        return response
+            self.metrics.record_http_5xx(method, _route_path_label(scope))
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app: FastAPI, limiter: RateLimiter, app_settings) -> None:
-        super().__init__(app)
-        self.limiter = limiter
-        self.app_settings = app_settings
+def _route_path_label(scope: Scope) -> str:
+    return getattr(scope.get("route"), "path", "unmatched")
 
-    async def dispatch(self, request: Request, call_next: Callable):
-        client = resolve_client_key(
-            request,
-            trust_proxy_headers=self.app_settings.trust_proxy_headers,
-            trusted_proxy_ips=self.app_settings.trusted_proxy_ips,
-            trusted_proxy_cidrs=self.app_settings.trusted_proxy_cidrs,
-        )
-        if not await self.limiter.allow(client):
-            return problem_details(
-                request=request,
-                status=429,
-                title="Too Many Requests",
-                detail="Rate limit exceeded",
-                type_=PROBLEM_TYPE_RATE_LIMIT,
-            )
-        return await call_next(request)
-
-
-def _resolve_cors_origins(app_settings) -> Iterable[str]:
+
+def _resolve_cors_origins(app_settings) -> frozenset[str]:
+    # CORSMiddleware only tests membership (`origin in allow_origins`), so a set keeps it O(1).
     if app_settings.cors_origins:
-        return app_settings.cors_origins
+        return frozenset(app_settings.cors_origins)
     if app_settings.strict_cors:
-        return []
+        return frozenset()
     if app_settings.app_env == "dev":
-        return ["http://localhost:3000"]
-    return []
+        return frozenset({"http://localhost:3000"})
+    return frozenset()
+
+
+_RESERVED_LOC_PARTS = frozenset({"body", "query", "path"})
+
+
+def _format_error_field(loc) -> str:
+    parts = []
+    for part in loc:
+        if isinstance(part, str):
+            if part not in _RESERVED_LOC_PARTS:
+                parts.append(part)
+        else:
+            parts.append(str(part))
+    return ".".join(parts)
+
+
+_ROUTERS = (
+    health_router,
+    public_router,
+    auth_router,
+    iam_router,
+    bot_router,
+    estimate_router,
+    chat_router,
+    client_router,
+    payments_router,
+    billing_router,
+    orders_router,
+    checklists_router,
+    time_tracking_router,
+    ui_lang_router,
+    worker_router,
+    bookings_router,
+    leads_router,
+    break_glass_router,
+    admin_router,
+    queues_router,
+    timeline_router,
+)
 
 
-def _try_include_style_guide(app: FastAPI) -> None:
+def _load_style_guide_router():
     try:
         from app.api.routes_style_guide import router as style_guide_router
     except Exception as exc:
         logger.warning("style_guide_disabled", extra={"extra": {"reason": str(exc)}})
-        return
-    app.include_router(style_guide_router)
+        return None
+    return style_guide_router
+
+
+def _resolve_routers(app_settings) -> list:
+    routers = list(_ROUTERS)
+    if app_settings.metrics_enabled:
+        from app.api.routes_metrics import router as metrics_router
+
+        routers.append(metrics_router)
+    style_guide_router = _load_style_guide_router()
+    if style_guide_router is not None:
+        routers.append(style_guide_router)
+    return routers
 
 
 def _validate_prod_config(app_settings) -> None:
@@ -248,13 +330,13 @@ def _validate_prod_config(app_settings) -> None:
     if getattr(app_settings, "metrics_enabled", False):
         _validate_secret(app_settings.metrics_token, "METRICS_TOKEN", minimum=16)
 
-    admin_credentials = [
+    admin_credentials = (
         (app_settings.owner_basic_username, app_settings.owner_basic_password),
         (app_settings.admin_basic_username, app_settings.admin_basic_password),
         (app_settings.dispatcher_basic_username, app_settings.dispatcher_basic_password),
         (app_settings.accountant_basic_username, app_settings.accountant_basic_password),
         (app_settings.viewer_basic_username, app_settings.viewer_basic_password),
-    ]
+    )
     if not any(username and password for username, password in admin_credentials):
         errors.append("At least one admin credential pair must be configured outside dev")
 
@@ -267,12 +349,14 @@ def _validate_prod_config(app_settings) -> None:
 def create_app(app_settings) -> FastAPI:
     configure_logging()
     metrics_client = configure_metrics(app_settings.metrics_enabled)
-    _validate_prod_config(app_settings)
 
     services = build_app_services(app_settings, metrics=metrics_client)
 
     @asynccontextmanager
     async def lifespan(app: FastAPI):
+        # Validated at startup rather than import so loading app.main stays cheap; a bad
+        # production config still aborts the server before it accepts traffic.
+        _validate_prod_config(app_settings)
         state_services = getattr(app.state, "services", None) or services
         app.state.services = state_services
 
@@ -288,6 +372,8 @@ def create_app(app_settings) -> FastAPI:
         app.state.export_resolver = getattr(app.state, "export_resolver", None)
         app.state.email_adapter = getattr(app.state, "email_adapter", None) or state_services.email_adapter
         app.state.stripe_client = getattr(app.state, "stripe_client", None) or state_services.stripe_client
+        await app.state.rate_limiter.preload()
+        await app.state.action_rate_limiter.preload()
         yield
         await app.state.rate_limiter.close()
         await app.state.action_rate_limiter.close()
@@ -296,9 +382,7 @@ def create_app(app_settings) -> FastAPI:
 
     app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-    app.add_middleware(WorkerAccessMiddleware)
-    app.add_middleware(AdminAuditMiddleware)
-    app.add_middleware(AdminAccessMiddleware)
+    app.add_middleware(AccessControlMiddleware)
     app.add_middleware(AdminSafetyMiddleware, app_settings=app_settings)
     app.add_middleware(PasswordChangeGateMiddleware)
     app.add_middleware(AdminMfaMiddleware, app_settings=app_settings)
@@ -306,25 +390,25 @@ def create_app(app_settings) -> FastAPI:
     # sees the populated request.state.saas_identity.
     app.add_middleware(TenantSessionMiddleware)
     app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(LoggingMiddleware)
     app.add_middleware(MetricsMiddleware, metrics_client=metrics_client)
-    app.add_middleware(RateLimitMiddleware, limiter=services.rate_limiter, app_settings=app_settings)
-    app.add_middleware(RequestIdMiddleware)
-
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=list(_resolve_cors_origins(app_settings)),
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    app.add_middleware(EdgeMiddleware, limiter=services.rate_limiter, app_settings=app_settings)
+
+    cors_origins = _resolve_cors_origins(app_settings)
+    # With no allowed origins CORSMiddleware can only strip/deny, so skip the extra middleware frame.
+    if cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=cors_origins,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
 
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(request: Request, exc: RequestValidationError):
         errors = []
         for error in exc.errors():
-            loc = error.get("loc", [])
-            field = ".".join(str(part) for part in loc if part not in {"body", "query", "path"}) or "body"
+            field = _format_error_field(error.get("loc", ())) or "body"
             errors.append({"field": field, "message": error.get("msg", "Invalid value")})
         return problem_details(
             request=request,
@@ -366,43 +450,13 @@ def create_app(app_settings) -> FastAPI:
         request_id = getattr(request.state, "request_id", None)
         logger.exception(
             "unhandled_exception",
-            extra={"request_id": request_id, "path": request.url.path, **identity_context},
-        )
-        return problem_details(
-            request=request,
-            status=500,
-            title="Internal Server Error",
-            detail="Unexpected error",
-            type_=PROBLEM_TYPE_SERVER,
+            extra={"request_id": request_id, "path": request.scope["path"], **identity_context},
         )
+        return SERVER_ERROR_PROBLEM.response(request)
 
 
-    app.include_router(health_router)
-    app.include_router(public_router)
-    app.include_router(auth_router)
-    app.include_router(iam_router)
-    app.include_router(bot_router)
-    app.include_router(estimate_router)
-    app.include_router(chat_router)
-    app.include_router(client_router)
-    app.include_router(payments_router)
-    app.include_router(billing_router)
-    app.include_router(orders_router)
-    app.include_router(checklists_router)
-    app.include_router(time_tracking_router)
-    app.include_router(ui_lang_router)
-    app.include_router(worker_router)
-    app.include_router(bookings_router)
-    app.include_router(leads_router)
-    app.include_router(break_glass_router)
-    app.include_router(admin_router)
-    app.include_router(queues_router)
-    app.include_router(timeline_router)
-    if app_settings.metrics_enabled:
-        from app.api.routes_metrics import router as metrics_router
-
-        app.include_router(metrics_router)
-    _try_include_style_guide(app)
+    for router in _resolve_routers(app_settings):
+        app.include_router(router)
     return app
 
 
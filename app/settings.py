@@ -1,5 +1,7 @@
 import json
+import os
 import uuid
+from functools import lru_cache
 from ipaddress import ip_network
 from typing import Literal
 
@@ -7,6 +9,44 @@ from pydantic import AliasChoices, Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+@lru_cache(maxsize=128)
+def _parse_raw_list(raw: str) -> tuple[str, ...]:
+    # List settings are exposed as properties over their raw strings and read on hot paths
+    # (proxy trust, CORS), so parse each distinct raw value once.
+    stripped = raw.strip()
+    if not stripped:
+        return ()
+    if stripped.startswith("["):
+        parsed = json.loads(stripped)
+        if isinstance(parsed, list):
+            return tuple(str(entry).strip() for entry in parsed if str(entry).strip())
+        return (str(parsed).strip(),) if str(parsed).strip() else ()
+    entries = (entry.strip() for entry in stripped.split(","))
+    return tuple(entry for entry in entries if entry)
+
+
+def _normalize_raw_list(value: object) -> str | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, list):
+        # Plain string lists round-trip through the comma form; JSON is only needed when an
+        # entry carries a comma or the joined value would itself look like a JSON array.
+        if all(isinstance(entry, str) and "," not in entry for entry in value):
+            joined = ",".join(value)
+            if not joined.lstrip().startswith("["):
+                return joined
+        return json.dumps(value)
+    return str(value)
+
+
+def _parse_list(raw: str | None) -> list[str]:
+    if raw is None:
+        return []
+    return list(_parse_raw_list(raw))
+
+
 class Settings(BaseSettings):
     app_name: str = "cleaning-economy-bot"
     cors_origins_raw: str | None = Field(None, validation_alias="cors_origins")
@@ -23,6 +63,8 @@ class Settings(BaseSettings):
     rate_limit_cleanup_minutes: int = Field(10)
     rate_limit_fail_open_seconds: int = Field(300)
     rate_limit_redis_probe_seconds: float = Field(5.0)
+    rate_limit_local_tokens: int = Field(0)
+    rate_limit_local_ttl_seconds: float = Field(1.0)
     time_overrun_reason_threshold: float = Field(1.2)
     trust_proxy_headers: bool = Field(False)
     trusted_proxy_ips_raw: str | None = Field(None, validation_alias="trusted_proxy_ips")
@@ -32,6 +74,7 @@ class Settings(BaseSettings):
     database_pool_size: int = Field(5)
     database_max_overflow: int = Field(5)
     database_pool_timeout_seconds: float = Field(30.0)
+    database_pool_recycle_seconds: int = Field(1800)
     database_statement_timeout_ms: int = Field(5000)
     email_mode: Literal["off", "sendgrid", "smtp"] = Field("off")
     email_from: str | None = Field(None)
@@ -191,7 +234,11 @@ class Settings(BaseSettings):
     dlq_auto_replay_export_cooldown_minutes: int = Field(120)
     default_org_id: uuid.UUID = Field(uuid.UUID("00000000-0000-0000-0000-000000000001"))
 
-    model_config = SettingsConfigDict(env_file=".env", enable_decoding=False)
+    # SETTINGS_ENV_FILE="" skips the dotenv read entirely (the test suite sets it).
+    model_config = SettingsConfigDict(
+        env_file=os.environ.get("SETTINGS_ENV_FILE", ".env") or None,
+        enable_decoding=False,
+    )
 
     @field_validator(
         "cors_origins_raw",
@@ -203,7 +250,7 @@ class Settings(BaseSettings):
     )
     @classmethod
     def normalize_list_raw(cls, value: object) -> str | None:
-        return cls._normalize_raw_list(value)
+        return _normalize_raw_list(value)
 
     @field_validator("deposit_percent")
     @classmethod
@@ -273,68 +320,68 @@ class Settings(BaseSettings):
 
     @property
     def cors_origins(self) -> list[str]:
-        return self._parse_list(self.cors_origins_raw)
+        return _parse_list(self.cors_origins_raw)
 
     @cors_origins.setter
     def cors_origins(self, value: list[str] | str | None) -> None:
-        self.cors_origins_raw = self._normalize_raw_list(value)
+        self.cors_origins_raw = _normalize_raw_list(value)
 
     @property
     def trusted_proxy_ips(self) -> list[str]:
-        return self._parse_list(self.trusted_proxy_ips_raw)
+        return _parse_list(self.trusted_proxy_ips_raw)
 
     @trusted_proxy_ips.setter
     def trusted_proxy_ips(self, value: list[str] | str | None) -> None:
-        self.trusted_proxy_ips_raw = self._normalize_raw_list(value)
+        self.trusted_proxy_ips_raw = _normalize_raw_list(value)
 
     @property
     def trusted_proxy_cidrs(self) -> list[str]:
-        return self._parse_list(self.trusted_proxy_cidrs_raw)
+        return _parse_list(self.trusted_proxy_cidrs_raw)
 
     @trusted_proxy_cidrs.setter
     def trusted_proxy_cidrs(self, value: list[str] | str | None) -> None:
-        self.trusted_proxy_cidrs_raw = self._normalize_raw_list(value)
+        self.trusted_proxy_cidrs_raw = _normalize_raw_list(value)
 
     @property
     def export_webhook_allowed_hosts(self) -> list[str]:
-        return self._parse_list(self.export_webhook_allowed_hosts_raw)
+        return _parse_list(self.export_webhook_allowed_hosts_raw)
 
     @export_webhook_allowed_hosts.setter
     def export_webhook_allowed_hosts(self, value: list[str] | str | None) -> None:
-        self.export_webhook_allowed_hosts_raw = self._normalize_raw_list(value)
+        self.export_webhook_allowed_hosts_raw = _normalize_raw_list(value)
 
     @property
     def admin_ip_allowlist_cidrs(self) -> list[str]:
-        return self._parse_list(self.admin_ip_allowlist_cidrs_raw)
+        return _parse_list(self.admin_ip_allowlist_cidrs_raw)
 
     @admin_ip_allowlist_cidrs.setter
     def admin_ip_allowlist_cidrs(self, value: list[str] | str | None) -> None:
-        self.admin_ip_allowlist_cidrs_raw = self._normalize_raw_list(value)
+        self.admin_ip_allowlist_cidrs_raw = _normalize_raw_list(value)
 
     @property
     def admin_mfa_required_roles(self) -> list[str]:
-        parsed = self._parse_list(self.admin_mfa_required_roles_raw)
+        parsed = _parse_list(self.admin_mfa_required_roles_raw)
         return parsed or ["owner", "admin"]
 
     @admin_mfa_required_roles.setter
     def admin_mfa_required_roles(self, value: list[str] | str | None) -> None:
-        self.admin_mfa_required_roles_raw = self._normalize_raw_list(value)
+        self.admin_mfa_required_roles_raw = _normalize_raw_list(value)
 
     @property
     def dlq_auto_replay_allow_outbox_kinds(self) -> list[str]:
-        return self._parse_list(self.dlq_auto_replay_allow_outbox_kinds_raw)
+        return _parse_list(self.dlq_auto_replay_allow_outbox_kinds_raw)
 
     @dlq_auto_replay_allow_outbox_kinds.setter
     def dlq_auto_replay_allow_outbox_kinds(self, value: list[str] | str | None) -> None:
-        self.dlq_auto_replay_allow_outbox_kinds_raw = self._normalize_raw_list(value)
+        self.dlq_auto_replay_allow_outbox_kinds_raw = _normalize_raw_list(value)
 
     @property
     def dlq_auto_replay_allow_export_modes(self) -> list[str]:
-        return self._parse_list(self.dlq_auto_replay_allow_export_modes_raw)
+        return _parse_list(self.dlq_auto_replay_allow_export_modes_raw)
 
     @dlq_auto_replay_allow_export_modes.setter
     def dlq_auto_replay_allow_export_modes(self, value: list[str] | str | None) -> None:
-        self.dlq_auto_replay_allow_export_modes_raw = self._normalize_raw_list(value)
+        self.dlq_auto_replay_allow_export_modes_raw = _normalize_raw_list(value)
 
     @property
     def email_sender(self) -> str | None:
@@ -344,34 +391,9 @@ class Settings(BaseSettings):
     def email_sender(self, value: str | None) -> None:
         self.email_from = value
 
-    @staticmethod
-    def _normalize_raw_list(value: object) -> str | None:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            return value
-        if isinstance(value, list):
-            return json.dumps(value)
-        return str(value)
-
-    @staticmethod
-    def _parse_list(raw: str | None) -> list[str]:
-        if raw is None:
-            return []
-        stripped = raw.strip()
-        if not stripped:
-            return []
-        if stripped.startswith("["):
-            parsed = json.loads(stripped)
-            if isinstance(parsed, list):
-                return [str(entry).strip() for entry in parsed if str(entry).strip()]
-            return [str(parsed).strip()] if str(parsed).strip() else []
-        entries = [entry.strip() for entry in stripped.split(",")]
-        return [entry for entry in entries if entry]
-
     @property
     def order_photo_allowed_mimes(self) -> list[str]:
-        parsed = self._parse_list(self.order_photo_allowed_mimes_raw)
+        parsed = _parse_list(self.order_photo_allowed_mimes_raw)
         if parsed:
             return parsed
         return ["image/jpeg", "image/png", "image/webp"]
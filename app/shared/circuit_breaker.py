@@ -47,12 +47,27 @@ class CircuitBreaker(Generic[T]):
             if asyncio.iscoroutine(result):
                 result = await result
         except Exception as exc:  # noqa: BLE001
-            await self._record_failure()
-            logger.warning("circuit_failure", extra={"extra": {"name": self.name, "state": self._state}})
+            await self._handle_failure()
             raise
         await self._record_success()
         return result  # type: ignore[return-value]
 
+    async def call_async(self, fn: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """Like ``call`` for callers that always pass a coroutine function."""
+
+        await self._ensure_available()
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception:  # noqa: BLE001
+            await self._handle_failure()
+            raise
+        await self._record_success()
+        return result
+
+    async def _handle_failure(self) -> None:
+        await self._record_failure()
+        logger.warning("circuit_failure", extra={"extra": {"name": self.name, "state": self._state}})
+
     async def _ensure_available(self) -> None:
         async with self._lock:
             now = time.monotonic()
@@ -0,0 +1,90 @@
+"""Database and client plumbing shared by tests/conftest.py and tests/smoke/conftest.py."""
+
+import asyncio
+from contextlib import contextmanager
+from datetime import time
+
+import sqlalchemy as sa
+
+from app.domain.bookings.db_models import TeamWorkingHours
+from app.domain.bookings.service import WORK_END_HOUR, WORK_START_HOUR
+from app.domain.saas.service import ensure_default_org_and_team
+from app.infra.bot_store import InMemoryBotStore
+from app.infra.db import get_db_session
+from app.main import app
+
+# Sync fixtures drive their coroutines on one loop for the whole session rather than paying for
+# a fresh loop per asyncio.run call; pooled Postgres connections also stay bound to the loop that
+# opened them. The root conftest closes it once every engine has been disposed.
+_FIXTURE_LOOP = asyncio.new_event_loop()
+
+
+def run_in_fixture_loop(coro):
+    return _FIXTURE_LOOP.run_until_complete(coro)
+
+
+def close_fixture_loop() -> None:
+    if not _FIXTURE_LOOP.is_closed():
+        _FIXTURE_LOOP.close()
+
+
+# One multi-row INSERT ... VALUES statement, built once, rather than an executemany per seed.
+_WORKING_HOURS_INSERT = sa.insert(TeamWorkingHours).values(
+    [
+        {
+            "team_id": 1,
+            "day_of_week": day,
+            "start_time": time(hour=WORK_START_HOUR, minute=0),
+            "end_time": time(hour=WORK_END_HOUR, minute=0),
+        }
+        for day in range(7)
+    ]
+)
+
+
+async def seed_defaults(session) -> None:
+    """Insert the default org, team and working hours every test starts from; the caller commits."""
+
+    await ensure_default_org_and_team(session)
+    await session.execute(_WORKING_HOURS_INSERT)
+
+
+class WriteTracker:
+    """Marks the database dirty whenever a statement other than a SELECT runs on the engine.
+
+    Tests that only read leave the seeded database untouched, so clean_database skips the reset
+    until something has written since the last one.
+    """
+
+    def __init__(self) -> None:
+        self.dirty = True
+
+    def attach(self, engine) -> None:
+        sa.event.listen(engine.sync_engine, "before_cursor_execute", self._track_writes)
+
+    def _track_writes(self, conn, cursor, statement, parameters, context, executemany) -> None:
+        if not statement.lstrip()[:6].upper().startswith("SELECT"):
+            self.dirty = True
+
+
+@contextmanager
+def bound_client(session_client, session_factory):
+    """Point a session-wide TestClient at ``session_factory`` for one test, then undo it."""
+
+    async def override_db_session():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = override_db_session
+    app.state.bot_store = InMemoryBotStore()
+    original_factory = getattr(app.state, "db_session_factory", None)
+    app.state.db_session_factory = session_factory
+    default_headers = session_client.headers.copy()
+    session_client.cookies.clear()
+    try:
+        yield session_client
+    finally:
+        session_client.headers = default_headers
+        session_client.cookies.clear()
+        app.dependency_overrides.clear()
+        app.state.db_session_factory = original_factory
@@ -1,12 +1,18 @@
 import asyncio
+import importlib
 import inspect
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+# Tests configure settings explicitly; never pick up a developer's local .env.
+os.environ.setdefault("SETTINGS_ENV_FILE", "")
+
 def ensure_event_loop() -> asyncio.AbstractEventLoop:
     try:
         loop = asyncio.get_running_loop()
@@ -23,84 +29,104 @@ def ensure_event_loop() -> asyncio.AbstractEventLoop:
 
 ensure_event_loop()
 
-import anyio
 import pytest
-import sqlalchemy as sa
 from sqlalchemy.pool import StaticPool
-from datetime import time
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 import uuid
 
-from app.domain.analytics import db_models as analytics_db_models  # noqa: F401
-from app.domain.bookings import db_models as booking_db_models  # noqa: F401
-from app.domain.bookings.service import WORK_END_HOUR, WORK_START_HOUR
-from app.domain.addons import db_models as addon_db_models  # noqa: F401
-from app.domain.export_events import db_models as export_events_db_models  # noqa: F401
-from app.domain.leads import db_models  # noqa: F401
-from app.domain.invoices import db_models as invoice_db_models  # noqa: F401
-from app.domain.data_rights import db_models as data_rights_db_models  # noqa: F401
-from app.domain.time_tracking import db_models as time_tracking_db_models  # noqa: F401
-from app.domain.reason_logs import db_models as reason_logs_db_models  # noqa: F401
-from app.domain.subscriptions import db_models as subscription_db_models  # noqa: F401
-from app.domain.checklists import db_models as checklist_db_models  # noqa: F401
-from app.domain.clients import db_models as client_db_models  # noqa: F401
-from app.domain.nps import db_models as nps_db_models  # noqa: F401
-from app.domain.disputes import db_models as dispute_db_models  # noqa: F401
-from app.domain.policy_overrides import db_models as policy_override_db_models  # noqa: F401
-from app.domain.admin_audit import db_models as admin_audit_db_models  # noqa: F401
-from app.domain.admin_idempotency import db_models as admin_idempotency_db_models  # noqa: F401
-from app.domain.documents import db_models as document_db_models  # noqa: F401
-from app.domain.break_glass import db_models as break_glass_db_models  # noqa: F401
-from app.domain.saas import db_models as saas_db_models  # noqa: F401
-from app.domain.outbox import db_models as outbox_db_models  # noqa: F401
-from app.domain.saas.service import ensure_default_org_and_team
-from app.domain.ops import db_models as ops_db_models  # noqa: F401
-from app.infra.bot_store import InMemoryBotStore
-from app.infra.db import Base, get_db_session
+from app.infra.db import Base
 from app.infra.org_context import set_current_org_id
 from app.main import app
 from app.settings import settings
+from tests._db_fixtures import (
+    WriteTracker,
+    bound_client,
+    close_fixture_loop,
+    run_in_fixture_loop,
+    seed_defaults,
+)
 
 DEFAULT_ORG_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 
+_DOMAIN_MODEL_MODULES = (
+    "app.domain.analytics.db_models",
+    "app.domain.bookings.db_models",
+    "app.domain.addons.db_models",
+    "app.domain.export_events.db_models",
+    "app.domain.leads.db_models",
+    "app.domain.invoices.db_models",
+    "app.domain.data_rights.db_models",
+    "app.domain.time_tracking.db_models",
+    "app.domain.reason_logs.db_models",
+    "app.domain.subscriptions.db_models",
+    "app.domain.checklists.db_models",
+    "app.domain.clients.db_models",
+    "app.domain.nps.db_models",
+    "app.domain.disputes.db_models",
+    "app.domain.policy_overrides.db_models",
+    "app.domain.admin_audit.db_models",
+    "app.domain.admin_idempotency.db_models",
+    "app.domain.documents.db_models",
+    "app.domain.break_glass.db_models",
+    "app.domain.saas.db_models",
+    "app.domain.outbox.db_models",
+    "app.domain.ops.db_models",
+)
+
+
+def _register_models() -> None:
+    # Tables only need to be on Base.metadata when create_all runs, so the model modules are
+    # imported by the engine fixture rather than at collection time.
+    for module_name in _DOMAIN_MODEL_MODULES:
+        importlib.import_module(module_name)
+
+
+async def _seed_database(engine) -> None:
+    seed_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with seed_session_factory() as session:
+        await seed_defaults(session)
+        await session.commit()
+
+
+_writes = WriteTracker()
+
 
 @pytest.fixture(scope="session")
-def test_engine():
-    db_path = Path("test.db")
-    if db_path.exists():
-        db_path.unlink()
+def _fixture_loop():
+    # Every engine fixture, the smoke one included, depends on this, so the shared loop is only
+    # closed after the last engine has been disposed on it.
+    yield
+    close_fixture_loop()
+
+
+@pytest.fixture(scope="session")
+def test_engine(_fixture_loop):
+    # StaticPool keeps the single connection, and with it the in-memory database, alive for the
+    # whole session; each pytest process gets its own private database and no file on disk.
     engine = create_async_engine(
-        "sqlite+aiosqlite:///./test.db",
-        connect_args={"check_same_thread": False, "timeout": 30},
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
 
-    seed_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    _register_models()
+    _writes.attach(engine)
 
     async def init_models() -> None:
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+        await _seed_database(engine)
 
-        async with seed_session_factory() as session:
-            await ensure_default_org_and_team(session)
-            await session.execute(
-                sa.insert(booking_db_models.TeamWorkingHours),
-                [
-                    {
-                        "team_id": 1,
-                        "day_of_week": day,
-                        "start_time": time(hour=WORK_START_HOUR, minute=0),
-                        "end_time": time(hour=WORK_END_HOUR, minute=0),
-                    }
-                    for day in range(7)
-                ],
-            )
-            await session.commit()
-
-    asyncio.run(init_models())
+    run_in_fixture_loop(init_models())
     yield engine
-    asyncio.run(engine.dispose())
+    run_in_fixture_loop(engine.dispose())
+
+
+@pytest.fixture()
+def run_async():
+    """Run a coroutine to completion on the shared fixture loop from a sync test."""
+    return run_in_fixture_loop
 
 
 @pytest.fixture(scope="session")
@@ -108,67 +134,47 @@ def async_session_maker(test_engine):
     return async_sessionmaker(test_engine, expire_on_commit=False)
 
 
+_RESTORED_SETTINGS = (
+    "admin_basic_username",
+    "admin_basic_password",
+    "dispatcher_basic_username",
+    "dispatcher_basic_password",
+    "testing",
+    "deposits_enabled",
+    "metrics_enabled",
+    "metrics_token",
+    "job_heartbeat_required",
+    "job_heartbeat_ttl_seconds",
+    "email_mode",
+    "legacy_basic_auth_enabled",
+    "auth_secret_key",
+    "admin_mfa_required",
+    "admin_mfa_required_roles_raw",
+    "admin_read_only",
+    "admin_ip_allowlist_cidrs_raw",
+    "trust_proxy_headers",
+    "trusted_proxy_ips_raw",
+    "trusted_proxy_cidrs_raw",
+    "dlq_auto_replay_enabled",
+    "dlq_auto_replay_allow_outbox_kinds_raw",
+    "dlq_auto_replay_allow_export_modes_raw",
+    "dlq_auto_replay_min_age_minutes",
+    "dlq_auto_replay_max_per_org",
+    "dlq_auto_replay_failure_streak_limit",
+    "dlq_auto_replay_outbox_attempt_ceiling",
+    "dlq_auto_replay_export_replay_limit",
+    "dlq_auto_replay_export_cooldown_minutes",
+)
+
+
 @pytest.fixture(autouse=True)
 def restore_admin_settings():
-    original_username = settings.admin_basic_username
-    original_password = settings.admin_basic_password
-    original_dispatcher_username = settings.dispatcher_basic_username
-    original_dispatcher_password = settings.dispatcher_basic_password
-    original_testing = getattr(settings, "testing", False)
-    original_deposits = getattr(settings, "deposits_enabled", True)
-    original_metrics = getattr(settings, "metrics_enabled", True)
-    original_metrics_token = getattr(settings, "metrics_token", None)
-    original_job_heartbeat = getattr(settings, "job_heartbeat_required", False)
-    original_job_heartbeat_ttl = getattr(settings, "job_heartbeat_ttl_seconds", 300)
-    original_email_mode = getattr(settings, "email_mode", "off")
-    original_legacy_basic_auth_enabled = getattr(settings, "legacy_basic_auth_enabled", True)
-    original_auth_secret_key = getattr(settings, "auth_secret_key", "")
-    original_admin_mfa_required = getattr(settings, "admin_mfa_required", False)
-    original_admin_mfa_roles = getattr(settings, "admin_mfa_required_roles_raw", None)
-    original_admin_read_only = getattr(settings, "admin_read_only", False)
-    original_admin_ip_allowlist = getattr(settings, "admin_ip_allowlist_cidrs_raw", None)
-    original_trust_proxy_headers = getattr(settings, "trust_proxy_headers", False)
-    original_trusted_proxy_ips = getattr(settings, "trusted_proxy_ips_raw", None)
-    original_trusted_proxy_cidrs = getattr(settings, "trusted_proxy_cidrs_raw", None)
-    original_dlq_auto_replay_enabled = getattr(settings, "dlq_auto_replay_enabled", False)
-    original_dlq_outbox_kinds = getattr(settings, "dlq_auto_replay_allow_outbox_kinds_raw", None)
-    original_dlq_export_modes = getattr(settings, "dlq_auto_replay_allow_export_modes_raw", None)
-    original_dlq_min_age = getattr(settings, "dlq_auto_replay_min_age_minutes", 60)
-    original_dlq_max_per_org = getattr(settings, "dlq_auto_replay_max_per_org", 5)
-    original_dlq_failure_streak = getattr(settings, "dlq_auto_replay_failure_streak_limit", 3)
-    original_dlq_outbox_attempt_ceiling = getattr(settings, "dlq_auto_replay_outbox_attempt_ceiling", 7)
-    original_dlq_export_replay_limit = getattr(settings, "dlq_auto_replay_export_replay_limit", 2)
-    original_dlq_export_cooldown = getattr(settings, "dlq_auto_replay_export_cooldown_minutes", 120)
+    # Every name is a declared field, so the snapshot reads and restores the instance dict
+    # directly instead of going through pydantic attribute access for each one.
+    fields = settings.__dict__
+    snapshot = {name: fields[name] for name in _RESTORED_SETTINGS}
     yield
-    settings.admin_basic_username = original_username
-    settings.admin_basic_password = original_password
-    settings.dispatcher_basic_username = original_dispatcher_username
-    settings.dispatcher_basic_password = original_dispatcher_password
-    settings.testing = original_testing
-    settings.deposits_enabled = original_deposits
-    settings.metrics_enabled = original_metrics
-    settings.metrics_token = original_metrics_token
-    settings.job_heartbeat_required = original_job_heartbeat
-    settings.job_heartbeat_ttl_seconds = original_job_heartbeat_ttl
-    settings.legacy_basic_auth_enabled = original_legacy_basic_auth_enabled
-    settings.auth_secret_key = original_auth_secret_key
-    settings.email_mode = original_email_mode
-    settings.admin_mfa_required = original_admin_mfa_required
-    settings.admin_mfa_required_roles_raw = original_admin_mfa_roles
-    settings.admin_read_only = original_admin_read_only
-    settings.admin_ip_allowlist_cidrs_raw = original_admin_ip_allowlist
-    settings.trust_proxy_headers = original_trust_proxy_headers
-    settings.trusted_proxy_ips_raw = original_trusted_proxy_ips
-    settings.trusted_proxy_cidrs_raw = original_trusted_proxy_cidrs
-    settings.dlq_auto_replay_enabled = original_dlq_auto_replay_enabled
-    settings.dlq_auto_replay_allow_outbox_kinds_raw = original_dlq_outbox_kinds
-    settings.dlq_auto_replay_allow_export_modes_raw = original_dlq_export_modes
-    settings.dlq_auto_replay_min_age_minutes = original_dlq_min_age
-    settings.dlq_auto_replay_max_per_org = original_dlq_max_per_org
-    settings.dlq_auto_replay_failure_streak_limit = original_dlq_failure_streak
-    settings.dlq_auto_replay_outbox_attempt_ceiling = original_dlq_outbox_attempt_ceiling
-    settings.dlq_auto_replay_export_replay_limit = original_dlq_export_replay_limit
-    settings.dlq_auto_replay_export_cooldown_minutes = original_dlq_export_cooldown
+    fields.update(snapshot)
 
 
 @pytest.fixture(autouse=True)
@@ -202,8 +208,10 @@ def restore_app_state():
         delattr(app.state, "app_settings")
 
 
-@pytest.fixture(autouse=True)
-def override_org_resolver(monkeypatch):
+@pytest.fixture(scope="session", autouse=True)
+def test_org_header_middleware():
+    # Registered before anything starts the app: Starlette refuses new middleware once the
+    # stack is built, and the session-wide client builds it on first use.
     if not getattr(app.state, "test_org_header_middleware_added", False):
 
         @app.middleware("http")
@@ -219,6 +227,9 @@ def override_org_resolver(monkeypatch):
 
         app.state.test_org_header_middleware_added = True
 
+
+@pytest.fixture(autouse=True)
+def override_org_resolver(monkeypatch, test_org_header_middleware):
     def _resolve_org_id(request):
         if request:
             state_org_id = getattr(request.state, "current_org_id", None)
@@ -246,89 +257,69 @@ def override_org_resolver(monkeypatch):
     yield
 
 
+@lru_cache(maxsize=1)
+def _truncate_script() -> str:
+    deletes = "".join(
+        f'DELETE FROM "{table.name}";\n' for table in reversed(Base.metadata.sorted_tables)
+    )
+    return f"BEGIN;\n{deletes}COMMIT;\n"
+
+
+@lru_cache(maxsize=None)
+def _has_async_reset(limiter_type: type) -> bool:
+    # Limiter types never change between tests, so the reflection only runs once per type.
+    return inspect.iscoroutinefunction(getattr(limiter_type, "reset", None))
+
+
 @pytest.fixture(autouse=True)
 def clean_database(test_engine):
     async def truncate_tables() -> None:
-        async with test_engine.begin() as conn:
-            for table in reversed(Base.metadata.sorted_tables):
-                await conn.execute(table.delete())
-
-        seed_session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
-        async with seed_session_factory() as session:
-            await ensure_default_org_and_team(session)
-            await session.execute(
-                sa.insert(booking_db_models.TeamWorkingHours),
-                [
-                    {
-                        "team_id": 1,
-                        "day_of_week": day,
-                        "start_time": time(hour=WORK_START_HOUR, minute=0),
-                        "end_time": time(hour=WORK_END_HOUR, minute=0),
-                    }
-                    for day in range(7)
-                ],
-            )
-            await session.commit()
-
-    asyncio.run(truncate_tables())
-    rate_limiter = getattr(app.state, "rate_limiter", None)
-    reset = getattr(rate_limiter, "reset", None) if rate_limiter else None
-    if reset:
-        if inspect.iscoroutinefunction(reset):
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                asyncio.run(reset())
-            else:
-                anyio.from_thread.run(reset)
+        # One executescript call runs every DELETE inside a single transaction on the aiosqlite
+        # worker thread, instead of a round trip per table.
+        async with test_engine.connect() as conn:
+            raw_connection = await conn.get_raw_connection()
+            await raw_connection.driver_connection.executescript(_truncate_script())
+        await _seed_database(test_engine)
+
+    if _writes.dirty:
+        run_in_fixture_loop(truncate_tables())
+        _writes.dirty = False
+    for limiter_name in ("rate_limiter", "action_rate_limiter"):
+        limiter = getattr(app.state, limiter_name, None)
+        reset = getattr(limiter, "reset", None) if limiter else None
+        if reset is None:
+            continue
+        if _has_async_reset(type(limiter)):
+            run_in_fixture_loop(reset())
         else:
             reset()
-    action_rate_limiter = getattr(app.state, "action_rate_limiter", None)
-    reset_action = getattr(action_rate_limiter, "reset", None) if action_rate_limiter else None
-    if reset_action:
-        if inspect.iscoroutinefunction(reset_action):
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                asyncio.run(reset_action())
-            else:
-                anyio.from_thread.run(reset_action)
-        else:
-            reset_action()
     yield
 
 
-@pytest.fixture()
-def client(async_session_maker):
-    ensure_event_loop()
+@pytest.fixture(scope="session")
+def _session_client(test_org_header_middleware):
+    # One TestClient per raise mode (and one lifespan startup each) for the whole session; the
+    # per-test fixtures below only swap the state each test depends on.
+    with TestClient(app) as test_client:
+        yield test_client
 
-    async def override_db_session():
-        async with async_session_maker() as session:
-            yield session
 
-    app.dependency_overrides[get_db_session] = override_db_session
-    app.state.bot_store = InMemoryBotStore()
-    original_factory = getattr(app.state, "db_session_factory", None)
-    app.state.db_session_factory = async_session_maker
-    with TestClient(app) as test_client:
+@pytest.fixture(scope="session")
+def _session_client_no_raise(test_org_header_middleware):
+    with TestClient(app, raise_server_exceptions=False) as test_client:
         yield test_client
-    app.dependency_overrides.clear()
-    app.state.db_session_factory = original_factory
 
 
 @pytest.fixture()
-def client_no_raise(async_session_maker):
-    """Test client that returns HTTP responses instead of raising server exceptions."""
+def client(_session_client, async_session_maker):
+    ensure_event_loop()
+    with bound_client(_session_client, async_session_maker) as test_client:
+        yield test_client
 
-    async def override_db_session():
-        async with async_session_maker() as session:
-            yield session
 
-    app.dependency_overrides[get_db_session] = override_db_session
-    app.state.bot_store = InMemoryBotStore()
-    original_factory = getattr(app.state, "db_session_factory", None)
-    app.state.db_session_factory = async_session_maker
-    with TestClient(app, raise_server_exceptions=False) as test_client:
+@pytest.fixture()
+def client_no_raise(_session_client_no_raise, async_session_maker):
+    """Test client that returns HTTP responses instead of raising server exceptions."""
+
+    with bound_client(_session_client_no_raise, async_session_maker) as test_client:
         yield test_client
-    app.dependency_overrides.clear()
-    app.state.db_session_factory = original_factory
@@ -1,20 +1,17 @@
-import asyncio
-from datetime import time
-import uuid
+from functools import lru_cache
 
 import pytest
 import sqlalchemy as sa
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from app.domain.bookings import db_models as booking_db_models
-from app.domain.bookings.service import WORK_END_HOUR, WORK_START_HOUR
-from app.domain.saas.service import ensure_default_org_and_team
-from app.domain.saas import db_models as saas_db_models
 from app.infra.db import Base
-from app.infra.org_context import set_current_org_id
 from app.settings import settings
+from tests._db_fixtures import WriteTracker, bound_client, run_in_fixture_loop, seed_defaults
 
-DEFAULT_ORG_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+# Only the engine differs from tests/conftest.py: smoke tests run against the Postgres database
+# in settings.database_url instead of the in-memory SQLite one, and reset it with TRUNCATE.
+# The session-wide TestClient, the X-Test-Org middleware and the settings/app.state fixtures
+# all come from the root conftest.
 
 
 async def _ensure_connection(engine) -> None:
@@ -22,15 +19,29 @@ async def _ensure_connection(engine) -> None:
         await conn.execute(sa.text("SELECT 1"))
 
 
+@lru_cache(maxsize=1)
+def _truncate_sql() -> str:
+    # Built on first reset, once every model module has registered its table.
+    table_names = [table.name for table in Base.metadata.sorted_tables]
+    if not table_names:
+        return ""
+    joined = ", ".join(f'"{name}"' for name in table_names)
+    return f"TRUNCATE TABLE {joined} CASCADE"
+
+
+_writes = WriteTracker()
+
+
 @pytest.fixture(scope="session")
-def test_engine():
+def test_engine(_fixture_loop):
     engine = create_async_engine(settings.database_url, pool_pre_ping=True)
+    _writes.attach(engine)
     try:
-        asyncio.run(_ensure_connection(engine))
+        run_in_fixture_loop(_ensure_connection(engine))
     except Exception:
         pytest.skip("Postgres is required for smoke tests")
     yield engine
-    asyncio.run(engine.dispose())
+    run_in_fixture_loop(engine.dispose())
 
 
 @pytest.fixture(scope="session")
@@ -41,70 +52,22 @@ def async_session_maker(test_engine):
 @pytest.fixture(autouse=True)
 def clean_database(test_engine):
     async def _reset() -> None:
+        # TRUNCATE and the reseed share one transaction, so each test pays a single commit.
         async with test_engine.begin() as conn:
-            table_names = [table.name for table in Base.metadata.sorted_tables]
-            if table_names:
-                joined = ", ".join(f'"{name}"' for name in table_names)
-                await conn.execute(sa.text(f"TRUNCATE TABLE {joined} RESTART IDENTITY CASCADE"))
-        seed_session_factory = async_sessionmaker(test_engine, expire_on_commit=False)
-        async with seed_session_factory() as session:
-            await ensure_default_org_and_team(session)
-            await session.execute(
-                sa.insert(booking_db_models.TeamWorkingHours),
-                [
-                    {
-                        "team_id": 1,
-                        "day_of_week": day,
-                        "start_time": time(hour=WORK_START_HOUR, minute=0),
-                        "end_time": time(hour=WORK_END_HOUR, minute=0),
-                    }
-                    for day in range(7)
-                ],
-            )
-            await session.commit()
-    asyncio.run(_reset())
+            truncate_sql = _truncate_sql()
+            if truncate_sql:
+                await conn.execute(sa.text(truncate_sql))
+            async with AsyncSession(bind=conn, expire_on_commit=False) as session:
+                await seed_defaults(session)
+                await session.flush()
+
+    if _writes.dirty:
+        run_in_fixture_loop(_reset())
+        _writes.dirty = False
     yield
 
 
 @pytest.fixture()
-def client(async_session_maker):
-    from fastapi.testclient import TestClient
-
-    from app.infra.db import get_db_session
-    from app.infra.bot_store import InMemoryBotStore
-    from app.main import app
-
-    async def override_db_session():
-        async with async_session_maker() as session:
-            yield session
-
-    app.dependency_overrides[get_db_session] = override_db_session
-    app.state.bot_store = InMemoryBotStore()
-    original_factory = getattr(app.state, "db_session_factory", None)
-    app.state.db_session_factory = async_session_maker
-    with TestClient(app) as test_client:
+def client(_session_client, async_session_maker):
+    with bound_client(_session_client, async_session_maker) as test_client:
         yield test_client
-    app.dependency_overrides.clear()
-    app.state.db_session_factory = original_factory
-
-
-@pytest.fixture(autouse=True)
-def _smoke_org_header_support():
-    from app.main import app
-
-    if not getattr(app.state, "smoke_org_header_middleware_added", False):
-
-        @app.middleware("http")
-        async def _inject_test_org(request, call_next):  # type: ignore[override]
-            header_value = request.headers.get("X-Test-Org")
-            if header_value:
-                try:
-                    request.state.current_org_id = uuid.UUID(header_value)
-                    set_current_org_id(request.state.current_org_id)
-                except Exception:  # noqa: BLE001
-                    pass
-            return await call_next(request)
-
-        app.state.smoke_org_header_middleware_added = True
-
-    yield
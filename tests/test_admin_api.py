@@ -14,6 +14,9 @@ def _basic_auth_header(username: str, password: str) -> dict[str, str]:
     return {"Authorization": f"Basic {token}"}
 
 
+ADMIN_AUTH = ("admin", "secret")
+
+
 def test_admin_leads_requires_auth(client_no_raise):
     original_username = settings.admin_basic_username
     original_password = settings.admin_basic_password
@@ -25,8 +28,7 @@ def test_admin_leads_requires_auth(client_no_raise):
         assert response.status_code == 401
         assert response.headers.get("WWW-Authenticate") == "Basic"
 
-        auth_headers = _basic_auth_header("admin", "secret")
-        authorized = client_no_raise.get("/v1/admin/leads", headers=auth_headers)
+        authorized = client_no_raise.get("/v1/admin/leads", auth=ADMIN_AUTH)
         assert authorized.status_code == 200
         assert isinstance(authorized.json(), list)
     finally:
@@ -65,8 +67,7 @@ def test_admin_cleanup_removes_old_pending_bookings(client, async_session_maker)
 
     asyncio.run(_seed())
 
-    headers = _basic_auth_header("admin", "secret")
-    response = client.post("/v1/admin/cleanup", headers=headers)
+    response = client.post("/v1/admin/cleanup", auth=ADMIN_AUTH)
     assert response.status_code == 202
     assert response.json()["deleted"] == 1
 
@@ -141,17 +142,16 @@ def test_admin_updates_lead_status_with_valid_transition(client, async_session_m
     settings.admin_basic_password = "secret"
 
     lead_id = _create_lead(client)
-    headers = _basic_auth_header("admin", "secret")
 
     transition = client.post(
         f"/v1/admin/leads/{lead_id}/status",
-        headers=headers,
+        auth=ADMIN_AUTH,
         json={"status": "CONTACTED"},
     )
     assert transition.status_code == 200
     assert transition.json()["status"] == "CONTACTED"
 
-    filtered = client.get("/v1/admin/leads", headers=headers, params={"status": "CONTACTED"})
+    filtered = client.get("/v1/admin/leads", auth=ADMIN_AUTH, params={"status": "CONTACTED"})
     assert filtered.status_code == 200
     assert any(lead["lead_id"] == lead_id for lead in filtered.json())
 
@@ -165,7 +165,7 @@ def test_admin_updates_lead_status_with_valid_transition(client, async_session_m
 
     invalid = client.post(
         f"/v1/admin/leads/{lead_id}/status",
-        headers=headers,
+        auth=ADMIN_AUTH,
         json={"status": "DONE"},
     )
     assert invalid.status_code == 400
@@ -221,8 +221,7 @@ def test_dispatcher_can_manage_bookings_but_not_pricing(client, async_session_ma
         pricing_attempt = client.post("/v1/admin/pricing/reload", headers=dispatcher_headers)
         assert pricing_attempt.status_code == 403
 
-        admin_headers = _basic_auth_header("admin", "secret")
-        admin_pricing = client.post("/v1/admin/pricing/reload", headers=admin_headers)
+        admin_pricing = client.post("/v1/admin/pricing/reload", auth=ADMIN_AUTH)
         assert admin_pricing.status_code == 202
     finally:
         settings.stripe_secret_key = original_stripe_key
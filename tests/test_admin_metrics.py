@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import uuid
 from datetime import datetime, timedelta, timezone
 from zoneinfo import ZoneInfo
@@ -18,21 +19,26 @@ def _auth() -> tuple[str, str]:
     return (settings.admin_basic_username, settings.admin_basic_password)
 
 
+_ESTIMATE_REQUEST = {
+    "beds": 2,
+    "baths": 1.5,
+    "cleaning_type": "standard",
+    "heavy_grease": False,
+    "multi_floor": False,
+    "frequency": "one_time",
+    "add_ons": {"oven": True},
+}
+_estimate_cache: dict[str, dict] = {}
+
+
 def _create_estimate(client):
-    response = client.post(
-        "/v1/estimate",
-        json={
-            "beds": 2,
-            "baths": 1.5,
-            "cleaning_type": "standard",
-            "heavy_grease": False,
-            "multi_floor": False,
-            "frequency": "one_time",
-            "add_ons": {"oven": True},
-        },
-    )
-    assert response.status_code == 200
-    return response.json()
+    # /v1/estimate is a pure function of the request and pricing config, so one call per
+    # session is enough; callers get their own copy because they patch fields like labor_cost.
+    if "standard" not in _estimate_cache:
+        response = client.post("/v1/estimate", json=_ESTIMATE_REQUEST)
+        assert response.status_code == 200
+        _estimate_cache["standard"] = response.json()
+    return copy.deepcopy(_estimate_cache["standard"])
 
 
 def test_admin_metrics_reports_conversions_and_accuracy(client, async_session_maker):
@@ -75,8 +81,9 @@ def test_admin_metrics_reports_conversions_and_accuracy(client, async_session_ma
     start_time_local = datetime.now(tz=local_tz).replace(
         hour=10, minute=0, second=0, microsecond=0
     ) + timedelta(days=1)
-    while start_time_local.weekday() >= 5:
-        start_time_local += timedelta(days=1)
+    weekday = start_time_local.weekday()
+    if weekday >= 5:
+        start_time_local += timedelta(days=7 - weekday)
     start_time = start_time_local.astimezone(timezone.utc)
     booking_response = client.post(
         "/v1/bookings",
@@ -1,5 +1,3 @@
-import asyncio
-import base64
 import uuid
 from datetime import date, datetime, timezone
 
@@ -10,12 +8,10 @@ from app.domain.invoices.schemas import InvoiceItemCreate
 from app.settings import settings
 
 
-def _basic_auth(username: str, password: str) -> dict[str, str]:
-    token = base64.b64encode(f"{username}:{password}".encode()).decode()
-    return {"Authorization": f"Basic {token}"}
+ADMIN_AUTH = ("admin", "secret")
 
 
-def _seed_invoice(async_session_maker):
+def _seed_invoice(async_session_maker, run_async):
     async def create():
         async with async_session_maker() as session:
             lead = Lead(
@@ -65,24 +61,23 @@ def _seed_invoice(async_session_maker):
             await session.commit()
             return invoice.invoice_id, token
 
-    return asyncio.run(create())
+    return run_async(create())
 
 
-def test_admin_invoice_ui_list_and_detail(client, async_session_maker):
+def test_admin_invoice_ui_list_and_detail(client, async_session_maker, run_async):
     previous_username = settings.admin_basic_username
     previous_password = settings.admin_basic_password
     settings.admin_basic_username = "admin"
     settings.admin_basic_password = "secret"
 
     try:
-        invoice_id, _ = _seed_invoice(async_session_maker)
+        invoice_id, _ = _seed_invoice(async_session_maker, run_async)
 
-        headers = _basic_auth("admin", "secret")
-        list_response = client.get("/v1/admin/ui/invoices", headers=headers)
+        list_response = client.get("/v1/admin/ui/invoices", auth=ADMIN_AUTH)
         assert list_response.status_code == 200
         assert "Invoices" in list_response.text
 
-        detail_response = client.get(f"/v1/admin/ui/invoices/{invoice_id}", headers=headers)
+        detail_response = client.get(f"/v1/admin/ui/invoices/{invoice_id}", auth=ADMIN_AUTH)
         assert detail_response.status_code == 200
         assert invoice_id in detail_response.text
         assert "Record manual payment" in detail_response.text
@@ -91,23 +86,22 @@ def test_admin_invoice_ui_list_and_detail(client, async_session_maker):
         settings.admin_basic_password = previous_password
 
 
-def test_invoice_surfaces_ignore_ui_lang(client, async_session_maker):
+def test_invoice_surfaces_ignore_ui_lang(client, async_session_maker, run_async):
     previous_username = settings.admin_basic_username
     previous_password = settings.admin_basic_password
     settings.admin_basic_username = "admin"
     settings.admin_basic_password = "secret"
 
     try:
-        invoice_id, token = _seed_invoice(async_session_maker)
-        headers = _basic_auth("admin", "secret")
+        invoice_id, token = _seed_invoice(async_session_maker, run_async)
         cookies = {"ui_lang": "ru"}
 
-        list_response = client.get("/v1/admin/ui/invoices", headers=headers, cookies=cookies)
+        list_response = client.get("/v1/admin/ui/invoices", auth=ADMIN_AUTH, cookies=cookies)
         assert list_response.status_code == 200
         assert "Invoices" in list_response.text
         assert "Счёт" not in list_response.text
 
-        detail_response = client.get(f"/v1/admin/ui/invoices/{invoice_id}", headers=headers, cookies=cookies)
+        detail_response = client.get(f"/v1/admin/ui/invoices/{invoice_id}", auth=ADMIN_AUTH, cookies=cookies)
         assert detail_response.status_code == 200
         for expected in ["Invoice", "Subtotal", "Tax", "Total"]:
             assert expected in detail_response.text
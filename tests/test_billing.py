@@ -73,8 +73,13 @@ async def test_free_plan_booking_limit_enforced(async_session_maker, client):
         await saas_service.create_membership(session, org, user, saas_service.MembershipRole.OWNER)
         await billing_service.set_plan(session, org.org_id, plan_id="free", status="active")
         limit = plans.get_plan("free").limits.max_bookings_per_month
-        for i in range(limit):
-            await billing_service.record_usage_event(session, org.org_id, metric="booking_created", resource_id=f"seed-{i}")
+        await session.execute(
+            sa.insert(OrganizationUsageEvent),
+            [
+                {"org_id": org.org_id, "metric": "booking_created", "quantity": 1, "resource_id": f"seed-{i}"}
+                for i in range(limit)
+            ],
+        )
         await session.commit()
 
     login = client.post(
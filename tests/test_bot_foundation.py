@@ -1,21 +1,19 @@
-import anyio
-
 from app.main import app
 
 
-def test_create_conversation(client):
+def test_create_conversation(client, run_async):
     response = client.post("/api/bot/session", json={"channel": "web", "anonId": "anon-1"})
     assert response.status_code == 201
     data = response.json()
     conversation_id = data["conversationId"]
 
-    stored = anyio.run(app.state.bot_store.get_conversation, conversation_id)
+    stored = run_async(app.state.bot_store.get_conversation(conversation_id))
     assert stored is not None
     assert stored.channel == "web"
     assert stored.anon_id == "anon-1"
 
 
-def test_post_message_updates_state(client):
+def test_post_message_updates_state(client, run_async):
     conversation_id = client.post("/api/bot/session", json={"channel": "web"}).json()["conversationId"]
 
     response = client.post(
@@ -28,16 +26,16 @@ def test_post_message_updates_state(client):
     assert body["reply"]["intent"] == "price"
     assert body["reply"]["state"]["fsmStep"] == "ask_service_type"
 
-    messages = anyio.run(app.state.bot_store.list_messages, conversation_id)
+    messages = run_async(app.state.bot_store.list_messages(conversation_id))
     assert len(messages) == 2
     assert messages[0].role == "user"
     assert messages[1].role == "bot"
 
-    conversation = anyio.run(app.state.bot_store.get_conversation, conversation_id)
+    conversation = run_async(app.state.bot_store.get_conversation(conversation_id))
     assert conversation.state.filled_fields["last_message"] == "I need a price quote"
 
 
-def test_message_normalizes_entities_into_state(client):
+def test_message_normalizes_entities_into_state(client, run_async):
     conversation_id = client.post("/api/bot/session", json={"channel": "web"}).json()["conversationId"]
 
     client.post(
@@ -48,7 +46,7 @@ def test_message_normalizes_entities_into_state(client):
         },
     )
 
-    conversation = anyio.run(app.state.bot_store.get_conversation, conversation_id)
+    conversation = run_async(app.state.bot_store.get_conversation(conversation_id))
     filled = conversation.state.filled_fields
     assert filled["service_type"] == "deep_clean"
     assert set(filled.get("extras", [])) == {"oven", "carpet"}
@@ -14,14 +14,12 @@ def _create_booking(client, starts_at: datetime) -> str:
     return response.json()["booking_id"]
 
 
-def _admin_auth():
-    return settings.admin_basic_username, settings.admin_basic_password
+ADMIN_AUTH = ("admin", "secret")
 
 
 @pytest.fixture(autouse=True)
 def _configure_admin():
-    settings.admin_basic_username = "admin"
-    settings.admin_basic_password = "secret"
+    settings.admin_basic_username, settings.admin_basic_password = ADMIN_AUTH
 
 
 @pytest.fixture()
@@ -39,7 +37,7 @@ def test_required_items_validation(client, template_payload):
     template_resp = client.post(
         "/v1/admin/checklists/templates",
         json=template_payload,
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert template_resp.status_code == 201
 
@@ -48,7 +46,7 @@ def test_required_items_validation(client, template_payload):
     init_resp = client.post(
         f"/v1/orders/{booking_id}/checklist/init",
         json={},
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert init_resp.status_code == 201
     run = init_resp.json()
@@ -59,13 +57,13 @@ def test_required_items_validation(client, template_payload):
     toggle_resp = client.patch(
         f"/v1/orders/{booking_id}/checklist/items/{before_item['run_item_id']}",
         json={"checked": True},
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert toggle_resp.status_code == 200
 
     complete_resp = client.post(
         f"/v1/orders/{booking_id}/checklist/complete",
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert complete_resp.status_code == 400
     assert "Required items" in complete_resp.json()["detail"]
@@ -73,12 +71,12 @@ def test_required_items_validation(client, template_payload):
     client.patch(
         f"/v1/orders/{booking_id}/checklist/items/{after_item['run_item_id']}",
         json={"checked": True},
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
 
     final_resp = client.post(
         f"/v1/orders/{booking_id}/checklist/complete",
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert final_resp.status_code == 200
     assert final_resp.json()["status"] == "completed"
@@ -95,13 +93,13 @@ def test_template_version_selection(client):
     first = client.post(
         "/v1/admin/checklists/templates",
         json=payload,
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert first.status_code == 201
     second = client.post(
         "/v1/admin/checklists/templates",
         json=payload,
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert second.status_code == 201
     latest_template = second.json()
@@ -110,7 +108,7 @@ def test_template_version_selection(client):
     init_one = client.post(
         f"/v1/orders/{booking_one}/checklist/init",
         json={"service_type": "deep_clean"},
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert init_one.status_code == 201
     assert init_one.json()["template_version"] == latest_template["version"]
@@ -118,7 +116,7 @@ def test_template_version_selection(client):
     deactivate = client.put(
         f"/v1/admin/checklists/templates/{latest_template['template_id']}",
         json={"is_active": False},
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert deactivate.status_code == 200
 
@@ -126,7 +124,7 @@ def test_template_version_selection(client):
     init_two = client.post(
         f"/v1/orders/{booking_two}/checklist/init",
         json={"service_type": "deep_clean"},
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert init_two.status_code == 201
     assert init_two.json()["template_version"] == 1
@@ -146,7 +144,7 @@ def test_update_used_template_creates_new_version(client):
     create_resp = client.post(
         "/v1/admin/checklists/templates",
         json=template_payload,
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert create_resp.status_code == 201
     original_template = create_resp.json()
@@ -158,7 +156,7 @@ def test_update_used_template_creates_new_version(client):
     init_resp = client.post(
         f"/v1/orders/{booking_id}/checklist/init",
         json={"service_type": "move"},
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert init_resp.status_code == 201
     run = init_resp.json()
@@ -176,7 +174,7 @@ def test_update_used_template_creates_new_version(client):
     update_resp = client.put(
         f"/v1/admin/checklists/templates/{original_template_id}",
         json=update_payload,
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert update_resp.status_code == 200
     new_template = update_resp.json()
@@ -190,7 +188,7 @@ def test_update_used_template_creates_new_version(client):
     # Verify old template was deactivated
     templates_resp = client.get(
         "/v1/admin/checklists/templates",
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert templates_resp.status_code == 200
     templates = templates_resp.json()
@@ -200,7 +198,7 @@ def test_update_used_template_creates_new_version(client):
     # CRITICAL: Verify existing run still works and references old template/items correctly
     get_checklist_resp = client.get(
         f"/v1/orders/{booking_id}/checklist",
-        auth=_admin_auth(),
+        auth=ADMIN_AUTH,
     )
     assert get_checklist_resp.status_code == 200
     checklist = get_checklist_resp.json()
@@ -34,3 +34,22 @@ async def test_circuit_half_open_allows_success_and_closes():
 
     assert result == "success"
     assert breaker.state == "closed"
+
+
+@pytest.mark.anyio
+async def test_call_async_awaits_coroutine_function_and_tracks_failures():
+    breaker = CircuitBreaker(name="s3", failure_threshold=1, recovery_time=10)
+
+    async def _ok(value: str) -> str:
+        return value
+
+    async def _fail() -> None:
+        raise RuntimeError("fail")
+
+    assert await breaker.call_async(_ok, "ok") == "ok"
+
+    with pytest.raises(RuntimeError):
+        await breaker.call_async(_fail)
+    with pytest.raises(CircuitBreakerOpenError):
+        await breaker.call_async(_ok, "ok")
+    assert breaker.state == "open"
@@ -1,4 +1,3 @@
-import asyncio
 from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock
 from zoneinfo import ZoneInfo
@@ -36,7 +35,7 @@ def test_magic_link_expiry():
         verify_magic_token(token, secret=secret)
 
 
-def test_client_cannot_access_foreign_order(client, async_session_maker):
+def test_client_cannot_access_foreign_order(client, async_session_maker, run_async):
     session_factory = async_session_maker
 
     async def seed_data():
@@ -74,7 +73,7 @@ def test_client_cannot_access_foreign_order(client, async_session_maker):
             await session.commit()
             return c1.client_id, c2.client_id
 
-    c1_id, _ = asyncio.run(seed_data())
+    c1_id, _ = run_async(seed_data())
 
     token = issue_magic_token(
         "c1@example.com",
@@ -93,7 +92,7 @@ def test_client_cannot_access_foreign_order(client, async_session_maker):
     assert allowed.status_code == 200
 
 
-def test_repeat_order_reevaluates_deposit_policy(client, async_session_maker, monkeypatch):
+def test_repeat_order_reevaluates_deposit_policy(client, async_session_maker, monkeypatch, run_async):
     """
     Regression test for repeat_order deposit bypass.
 
@@ -159,7 +158,7 @@ def test_repeat_order_reevaluates_deposit_policy(client, async_session_maker, mo
             await session.commit()
             return client_user.client_id
 
-    client_id = asyncio.run(seed_data())
+    client_id = run_async(seed_data())
 
     # Monkeypatch evaluate_deposit_policy to return a decision requiring deposit
     # This simulates the case where the new booking date triggers deposit rules
@@ -241,4 +240,4 @@ def test_repeat_order_reevaluates_deposit_policy(client, async_session_maker, mo
             assert repeated_booking.deposit_status == "pending"
 
     import sqlalchemy as sa
-    asyncio.run(verify_deposit())
+    run_async(verify_deposit())
@@ -1,4 +1,5 @@
 import pytest
+from fastapi.middleware.cors import CORSMiddleware
 from fastapi.testclient import TestClient
 from pydantic import ValidationError
 
@@ -35,3 +36,38 @@ def test_cors_allows_configured_origin():
     with TestClient(app) as client:
         response = client.get("/healthz", headers={"Origin": "https://example.com"})
         assert response.headers["access-control-allow-origin"] == "https://example.com"
+
+
+def test_cors_middleware_skipped_without_origins():
+    app = create_app(
+        Settings(
+            app_env="prod",
+            cors_origins=[],
+            auth_secret_key="super-secret",
+            client_portal_secret="client-secret",
+            worker_portal_secret="worker-secret",
+            metrics_enabled=False,
+        )
+    )
+
+    assert all(middleware.cls is not CORSMiddleware for middleware in app.user_middleware)
+    with TestClient(app) as client:
+        response = client.get("/healthz", headers={"Origin": "https://example.com"})
+        assert "access-control-allow-origin" not in response.headers
+
+
+def test_cors_origins_resolve_to_a_set():
+    from app.main import _resolve_cors_origins
+
+    origins = _resolve_cors_origins(
+        Settings(
+            app_env="prod",
+            cors_origins=["https://a.example.com", "https://b.example.com"],
+            auth_secret_key="super-secret",
+            client_portal_secret="client-secret",
+            worker_portal_secret="worker-secret",
+            metrics_enabled=False,
+        )
+    )
+
+    assert origins == frozenset({"https://a.example.com", "https://b.example.com"})
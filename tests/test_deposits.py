@@ -1,7 +1,6 @@
 import json
 import time
 from datetime import datetime, timedelta, timezone
-import asyncio
 from types import SimpleNamespace
 from zoneinfo import ZoneInfo
 
@@ -37,7 +36,7 @@ def _stub_stripe(session_id: str) -> object:
     return SimpleNamespace(api_key=None, checkout=checkout, Webhook=stripe.Webhook, verify_webhook=verify_webhook)
 
 
-def _seed_lead(async_session_maker) -> str:
+def _seed_lead(async_session_maker, run_async) -> str:
     async def _create() -> str:
         async with async_session_maker() as session:
             lead = Lead(
@@ -61,12 +60,10 @@ def _seed_lead(async_session_maker) -> str:
             await session.refresh(lead)
             return lead.lead_id
 
-    import asyncio
+    return run_async(_create())
 
-    return asyncio.run(_create())
 
-
-def _seed_returning_lead(async_session_maker) -> str:
+def _seed_returning_lead(async_session_maker, run_async) -> str:
     async def _create() -> str:
         async with async_session_maker() as session:
             lead = Lead(
@@ -100,9 +97,7 @@ def _seed_returning_lead(async_session_maker) -> str:
             await session.refresh(lead)
             return lead.lead_id
 
-    import asyncio
-
-    return asyncio.run(_create())
+    return run_async(_create())
 
 
 def _booking_start_in_days(days: int, hour: int = 10) -> str:
@@ -121,26 +116,22 @@ def _booking_start_in_hours(hours: int) -> str:
     return target_local.astimezone(timezone.utc).isoformat()
 
 
-def _count_bookings(async_session_maker) -> int:
+def _count_bookings(async_session_maker, run_async) -> int:
     async def _count() -> int:
         async with async_session_maker() as session:
             result = await session.execute(sa.select(sa.func.count()).select_from(Booking))
             return int(result.scalar_one())
 
-    import asyncio
+    return run_async(_count())
 
-    return asyncio.run(_count())
 
-
-def _count_email_events(async_session_maker) -> int:
+def _count_email_events(async_session_maker, run_async) -> int:
     async def _count() -> int:
         async with async_session_maker() as session:
             result = await session.execute(sa.select(sa.func.count()).select_from(EmailEvent))
             return int(result.scalar_one())
 
-    import asyncio
-
-    return asyncio.run(_count())
+    return run_async(_count())
 
 
 class RecordingAdapter:
@@ -152,14 +143,14 @@ class RecordingAdapter:
         return True
 
 
-def test_booking_response_includes_deposit_policy(client, async_session_maker, monkeypatch):
+def test_booking_response_includes_deposit_policy(client, async_session_maker, monkeypatch, run_async):
     settings.deposits_enabled = True
     settings.stripe_secret_key = "sk_test"
     settings.stripe_webhook_secret = "whsec_test"
     original_client = getattr(app.state, "stripe_client", None)
     try:
         app.state.stripe_client = _stub_stripe("cs_test_deposit")
-        lead_id = _seed_lead(async_session_maker)
+        lead_id = _seed_lead(async_session_maker, run_async)
 
         payload = {
             "starts_at": _booking_start_in_days(5),
@@ -181,7 +172,7 @@ def test_booking_response_includes_deposit_policy(client, async_session_maker, m
         app.state.stripe_client = original_client
 
 
-def test_missing_stripe_key_downgrades_deposit(client, async_session_maker):
+def test_missing_stripe_key_downgrades_deposit(client, async_session_maker, run_async):
     settings.deposits_enabled = True
     original_secret = settings.stripe_secret_key
     settings.stripe_secret_key = None
@@ -189,7 +180,7 @@ def test_missing_stripe_key_downgrades_deposit(client, async_session_maker):
     original_adapter = getattr(app.state, "email_adapter", None)
     app.state.email_adapter = adapter
 
-    lead_id = _seed_lead(async_session_maker)
+    lead_id = _seed_lead(async_session_maker, run_async)
     payload = {
         "starts_at": _booking_start_in_days(4),
         "time_on_site_hours": 2,
@@ -204,13 +195,13 @@ def test_missing_stripe_key_downgrades_deposit(client, async_session_maker):
         assert any("stripe_unavailable" in reason for reason in data["deposit_policy"])
         assert data["deposit_status"] is None
         assert data["policy_snapshot"]["deposit"]["downgraded_reason"] == "stripe_unavailable"
-        assert _count_bookings(async_session_maker) == 1
+        assert _count_bookings(async_session_maker, run_async) == 1
     finally:
         app.state.email_adapter = original_adapter
         settings.stripe_secret_key = original_secret
 
 
-def test_checkout_failure_downgrades_booking(client, async_session_maker, monkeypatch):
+def test_checkout_failure_downgrades_booking(client, async_session_maker, monkeypatch, run_async):
     settings.deposits_enabled = True
     original_secret = settings.stripe_secret_key
     settings.stripe_secret_key = "sk_test"
@@ -222,7 +213,7 @@ def test_checkout_failure_downgrades_booking(client, async_session_maker, monkey
         raise RuntimeError("stripe_down")
 
     monkeypatch.setattr(stripe_infra, "create_checkout_session", _raise)
-    lead_id = _seed_lead(async_session_maker)
+    lead_id = _seed_lead(async_session_maker, run_async)
     payload = {
         "starts_at": _booking_start_in_days(4),
         "time_on_site_hours": 2,
@@ -242,7 +233,7 @@ def test_checkout_failure_downgrades_booking(client, async_session_maker, monkey
             async with async_session_maker() as session:
                 return await session.get(Booking, booking_id)
 
-        booking = asyncio.run(_fetch_booking())
+        booking = run_async(_fetch_booking())
         assert booking is not None
         assert booking.deposit_required is False
         assert booking.deposit_status is None
@@ -255,7 +246,7 @@ def test_checkout_failure_downgrades_booking(client, async_session_maker, monkey
         settings.stripe_secret_key = original_secret
 
 
-def test_non_deposit_booking_persists(client, async_session_maker):
+def test_non_deposit_booking_persists(client, async_session_maker, run_async):
     original_secret = settings.stripe_secret_key
     settings.stripe_secret_key = None
     payload = {"starts_at": _booking_start_in_days(5), "time_on_site_hours": 1}
@@ -265,14 +256,14 @@ def test_non_deposit_booking_persists(client, async_session_maker):
         assert response.status_code == 201
         data = response.json()
         assert data["deposit_required"] is False
-        assert _count_bookings(async_session_maker) == 1
+        assert _count_bookings(async_session_maker, run_async) == 1
     finally:
         settings.stripe_secret_key = original_secret
 
 
-def test_returning_client_can_book_without_deposit(client, async_session_maker):
+def test_returning_client_can_book_without_deposit(client, async_session_maker, run_async):
     settings.stripe_secret_key = None
-    lead_id = _seed_returning_lead(async_session_maker)
+    lead_id = _seed_returning_lead(async_session_maker, run_async)
     starts_at = _booking_start_in_days(6)
 
     response = client.post(
@@ -286,14 +277,14 @@ def test_returning_client_can_book_without_deposit(client, async_session_maker):
     assert data["policy_snapshot"]["deposit"]["required"] is False
 
 
-def test_short_notice_policy_snapshot(client, async_session_maker):
+def test_short_notice_policy_snapshot(client, async_session_maker, run_async):
     settings.deposits_enabled = True
     settings.stripe_secret_key = "sk_test"
     settings.stripe_webhook_secret = "whsec_test"
     original_client = getattr(app.state, "stripe_client", None)
     try:
         app.state.stripe_client = _stub_stripe("cs_short_notice")
-        lead_id = _seed_lead(async_session_maker)
+        lead_id = _seed_lead(async_session_maker, run_async)
         payload = {
             "starts_at": _booking_start_in_hours(12),
             "time_on_site_hours": 2,
@@ -316,22 +307,20 @@ def test_short_notice_policy_snapshot(client, async_session_maker):
                 booking = result.scalar_one()
                 return booking.policy_snapshot or {}
 
-        import asyncio
-
-        stored_snapshot = asyncio.run(_fetch())
+        stored_snapshot = run_async(_fetch())
         assert stored_snapshot.get("deposit", {}).get("amount_cents") == data["deposit_cents"]
     finally:
         app.state.stripe_client = original_client
 
 
-def test_webhook_confirms_booking(client, async_session_maker):
+def test_webhook_confirms_booking(client, async_session_maker, run_async):
     settings.deposits_enabled = True
     settings.stripe_secret_key = "sk_test"
     settings.stripe_webhook_secret = "whsec_test"
     original_client = getattr(app.state, "stripe_client", None)
     try:
         app.state.stripe_client = _stub_stripe("cs_webhook")
-        lead_id = _seed_lead(async_session_maker)
+        lead_id = _seed_lead(async_session_maker, run_async)
 
         payload = {
             "starts_at": _booking_start_in_days(4),
@@ -360,9 +349,7 @@ def test_webhook_confirms_booking(client, async_session_maker):
                 result = await session.execute(sa.select(Booking).limit(1))
                 return result.scalar_one()
 
-        import asyncio
-
-        booking = asyncio.run(_fetch())
+        booking = run_async(_fetch())
         assert booking.status == "CONFIRMED"
         assert booking.deposit_status == "paid"
         assert booking.stripe_payment_intent_id == "pi_live"
@@ -370,14 +357,14 @@ def test_webhook_confirms_booking(client, async_session_maker):
         app.state.stripe_client = original_client
 
 
-def test_webhook_requires_paid_status(client, async_session_maker):
+def test_webhook_requires_paid_status(client, async_session_maker, run_async):
     settings.deposits_enabled = True
     settings.stripe_secret_key = "sk_test"
     settings.stripe_webhook_secret = "whsec_test"
     original_client = getattr(app.state, "stripe_client", None)
     try:
         app.state.stripe_client = _stub_stripe("cs_unpaid")
-        lead_id = _seed_lead(async_session_maker)
+        lead_id = _seed_lead(async_session_maker, run_async)
 
         creation = client.post(
             "/v1/bookings",
@@ -404,23 +391,21 @@ def test_webhook_requires_paid_status(client, async_session_maker):
                 result = await session.execute(sa.select(Booking).limit(1))
                 return result.scalar_one()
 
-        import asyncio
-
-        booking = asyncio.run(_fetch())
+        booking = run_async(_fetch())
         assert booking.status == "PENDING"
         assert booking.deposit_status == "pending"
     finally:
         app.state.stripe_client = original_client
 
 
-def test_webhook_expired_cancels_pending(client, async_session_maker):
+def test_webhook_expired_cancels_pending(client, async_session_maker, run_async):
     settings.deposits_enabled = True
     settings.stripe_secret_key = "sk_test"
     settings.stripe_webhook_secret = "whsec_test"
     original_client = getattr(app.state, "stripe_client", None)
     try:
         app.state.stripe_client = _stub_stripe("cs_expired")
-        lead_id = _seed_lead(async_session_maker)
+        lead_id = _seed_lead(async_session_maker, run_async)
 
         creation = client.post(
             "/v1/bookings",
@@ -447,9 +432,7 @@ def test_webhook_expired_cancels_pending(client, async_session_maker):
                 result = await session.execute(sa.select(Booking).limit(1))
                 return result.scalar_one()
 
-        import asyncio
-
-        booking = asyncio.run(_fetch())
+        booking = run_async(_fetch())
         assert booking.status == "CANCELLED"
         assert booking.deposit_status == "expired"
     finally:
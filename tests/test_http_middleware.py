@@ -0,0 +1,90 @@
+def test_response_carries_request_id_and_security_headers(client):
+    response = client.get("/healthz", headers={"X-Request-ID": "req-abc"})
+
+    assert response.status_code == 200
+    assert response.headers["X-Request-ID"] == "req-abc"
+    assert response.headers["X-Content-Type-Options"] == "nosniff"
+    assert response.headers["X-Frame-Options"] == "DENY"
+    assert response.headers["Referrer-Policy"] == "no-referrer"
+    assert response.headers["Content-Security-Policy"].startswith("default-src 'self'")
+
+
+def test_request_id_generated_when_missing(client):
+    first = client.get("/healthz")
+    second = client.get("/healthz")
+
+    assert first.headers["X-Request-ID"]
+    assert first.headers["X-Request-ID"] != second.headers["X-Request-ID"]
+
+
+def test_security_headers_do_not_override_route_values(client):
+    from app.main import app
+    from fastapi.responses import PlainTextResponse
+
+    async def framed():  # pragma: no cover - executed via HTTP
+        return PlainTextResponse("ok", headers={"X-Frame-Options": "SAMEORIGIN"})
+
+    route_path = "/framed-test"
+    app.router.add_api_route(route_path, framed, methods=["GET"])
+    try:
+        response = client.get(route_path)
+    finally:
+        app.router.routes = [r for r in app.router.routes if getattr(r, "path", None) != route_path]
+
+    assert response.headers["X-Frame-Options"] == "SAMEORIGIN"
+    assert response.headers.get_list("X-Frame-Options") == ["SAMEORIGIN"]
+
+
+def test_next_request_id_returns_unique_hex_strings():
+    from app.infra.request_id import _REQUEST_ID_BATCH_SIZE, next_request_id
+
+    ids = [next_request_id() for _ in range(_REQUEST_ID_BATCH_SIZE + 5)]
+
+    assert len(set(ids)) == len(ids)
+    assert all(len(value) == 32 and int(value, 16) >= 0 for value in ids)
+
+
+def test_request_log_line_includes_latency_and_status(client, caplog):
+    import logging
+
+    with caplog.at_level(logging.INFO, logger="app.request"):
+        client.get("/healthz")
+
+    records = [record for record in caplog.records if record.name == "app.request"]
+    assert records
+    assert isinstance(records[-1].latency_ms, int)
+    assert records[-1].latency_ms >= 0
+    assert records[-1].status_code == 200
+
+
+def test_access_control_only_guards_admin_and_worker_paths(client):
+    from app.api.access_control import AccessControlMiddleware
+    from app.main import app
+
+    assert sum(middleware.cls is AccessControlMiddleware for middleware in app.user_middleware) == 1
+    assert client.get("/healthz").status_code == 200
+    assert client.get("/worker").status_code == 401
+    assert client.get("/v1/admin/profile").status_code == 401
+
+
+def test_rate_limit_skips_probes_and_keeps_request_id_on_denial(client):
+    import asyncio
+
+    from app.main import app
+
+    limiter = app.state.rate_limiter
+    previous_limit = limiter.requests_per_minute
+    asyncio.run(limiter.reset())
+    limiter.requests_per_minute = 1
+    try:
+        probes = [client.get("/healthz") for _ in range(3)]
+        client.get("/ui/lang?lang=en", follow_redirects=False)
+        denied = client.get("/ui/lang?lang=en", headers={"X-Request-ID": "req-limited"}, follow_redirects=False)
+    finally:
+        limiter.requests_per_minute = previous_limit
+        asyncio.run(limiter.reset())
+
+    assert [probe.status_code for probe in probes] == [200, 200, 200]
+    assert denied.status_code == 429
+    assert denied.headers["X-Request-ID"] == "req-limited"
+    assert denied.json()["request_id"] == "req-limited"
@@ -28,10 +28,6 @@ class _DummySession:
         return None
 
 
-def _session_factory():
-    return _DummySession()
-
-
 @pytest.mark.anyio
 async def test_run_job_clears_log_context():
     clear_log_context()
@@ -40,7 +36,7 @@ async def test_run_job_clears_log_context():
         update_log_context(job="dummy", value="one")
         return {"sent": 1}
 
-    await run._run_job("dummy", _session_factory, _runner)
+    await run._run_job("dummy", _DummySession(), _runner)
     assert LOG_CONTEXT.get({}) == {}
 
 
@@ -0,0 +1,128 @@
+import asyncio
+import functools
+
+import pytest
+
+from app.jobs import run
+
+
+def test_job_runner_binds_registered_dependencies():
+    adapter = object()
+
+    runner = run._job_runner("invoice-reminders", adapter=adapter, base_url="https://example.com")
+
+    assert isinstance(runner, functools.partial)
+    assert runner.func is run.email_jobs.run_invoice_notifications
+    assert runner.keywords == {"adapter": adapter, "base_url": "https://example.com"}
+
+
+def test_job_runner_covers_every_registered_job():
+    for name in run.JOBS:
+        assert isinstance(run._job_runner(name), functools.partial)
+
+
+def test_job_runner_rejects_unknown_job():
+    with pytest.raises(ValueError, match="unknown_job:nope"):
+        run._job_runner("nope")
+
+
+@pytest.mark.anyio
+async def test_main_rejects_unknown_job_at_parse_time():
+    with pytest.raises(SystemExit):
+        await run.main(["--job", "nope", "--once"])
+
+
+def test_job_concurrency_is_capped_by_db_pool(monkeypatch):
+    monkeypatch.setattr(run.settings, "database_pool_size", 2)
+    monkeypatch.setattr(run.settings, "database_max_overflow", 1)
+
+    assert run._job_concurrency(8) == 3
+    assert run._job_concurrency(2) == 2
+    assert run._job_concurrency(0) == 1
+
+
+@pytest.mark.anyio
+async def test_main_records_job_results_and_heartbeat(async_session_maker, monkeypatch):
+    from app.domain.ops.db_models import JobHeartbeat
+
+    async def _ok(session):
+        return {"sent": 0}
+
+    async def _boom(session):
+        raise RuntimeError("boom")
+
+    monkeypatch.setitem(run.JOBS, "ok-job", (_ok, ()))
+    monkeypatch.setitem(run.JOBS, "bad-job", (_boom, ()))
+    monkeypatch.setattr(run, "get_session_factory", lambda: async_session_maker)
+    monkeypatch.setattr(run, "resolve_email_adapter", lambda _settings: None)
+    monkeypatch.setattr(run, "new_storage_backend", lambda: None)
+
+    await run.main(["--job", "ok-job", "--job", "bad-job", "--once"])
+    await run.main(["--job", "ok-job", "--job", "bad-job", "--once"])
+
+    async with async_session_maker() as session:
+        ok = await session.get(JobHeartbeat, "ok-job")
+        bad = await session.get(JobHeartbeat, "bad-job")
+        runner = await session.get(JobHeartbeat, "jobs-runner")
+
+    assert ok is not None and ok.last_success_at is not None
+    assert bad is not None and bad.consecutive_failures == 1
+    assert bad.last_error == "RuntimeError"
+    assert runner is not None
+
+
+@pytest.mark.anyio
+async def test_main_runs_jobs_concurrently(async_session_maker, monkeypatch):
+    first_started = asyncio.Event()
+    second_started = asyncio.Event()
+
+    async def _first(session):
+        first_started.set()
+        await asyncio.wait_for(second_started.wait(), timeout=2)
+        return {}
+
+    async def _second(session):
+        second_started.set()
+        await asyncio.wait_for(first_started.wait(), timeout=2)
+        return {}
+
+    monkeypatch.setitem(run.JOBS, "first-job", (_first, ()))
+    monkeypatch.setitem(run.JOBS, "second-job", (_second, ()))
+    monkeypatch.setattr(run, "CONCURRENT_JOBS", frozenset({"first-job", "second-job"}))
+    monkeypatch.setattr(run, "get_session_factory", lambda: async_session_maker)
+    monkeypatch.setattr(run, "resolve_email_adapter", lambda _settings: None)
+    monkeypatch.setattr(run, "new_storage_backend", lambda: None)
+    monkeypatch.setattr(run, "_record_job_result", _noop_record_job_result)
+
+    await run.main(["--job", "first-job", "--job", "second-job", "--once", "--concurrency", "2"])
+
+    assert first_started.is_set() and second_started.is_set()
+
+
+@pytest.mark.anyio
+async def test_main_runs_other_jobs_one_at_a_time(async_session_maker, monkeypatch):
+    events: list[str] = []
+
+    def _job(name):
+        async def _run(session):
+            events.append(f"{name}:start")
+            await asyncio.sleep(0)
+            events.append(f"{name}:end")
+            return {}
+
+        return _run
+
+    monkeypatch.setitem(run.JOBS, "first-job", (_job("first"), ()))
+    monkeypatch.setitem(run.JOBS, "second-job", (_job("second"), ()))
+    monkeypatch.setattr(run, "get_session_factory", lambda: async_session_maker)
+    monkeypatch.setattr(run, "resolve_email_adapter", lambda _settings: None)
+    monkeypatch.setattr(run, "new_storage_backend", lambda: None)
+    monkeypatch.setattr(run, "_record_job_result", _noop_record_job_result)
+
+    await run.main(["--job", "first-job", "--job", "second-job", "--once", "--concurrency", "2"])
+
+    assert events == ["first:start", "first:end", "second:start", "second:end"]
+
+
+async def _noop_record_job_result(session, job, *, success, error_reason=None):
+    return None
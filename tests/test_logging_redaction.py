@@ -54,3 +54,12 @@ def test_request_id_present_in_logs_and_response(client_no_raise, capsys):
     log_payload = json.loads(unhandled_line)
     assert log_payload.get("request_id") == "req-123"
     _remove_route(route_path)
+
+
+def test_configure_logging_is_idempotent():
+    configure_logging()
+    handlers = list(logging.getLogger().handlers)
+
+    configure_logging()
+
+    assert logging.getLogger().handlers == handlers
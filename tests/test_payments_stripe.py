@@ -87,6 +87,12 @@ def test_deposit_checkout_and_webhook(client, async_session_maker, monkeypatch):
     assert duplicate.status_code == 200
     assert duplicate.json()["processed"] is False
 
+    replayed = client.post(
+        "/v1/payments/stripe/webhook", content=b'{"replayed": true}', headers={"Stripe-Signature": "t=test"}
+    )
+    assert replayed.status_code == 400
+    assert replayed.json()["detail"] == "Event payload mismatch"
+
 
 def test_deposit_checkout_then_payment_intent_single_payment(client, async_session_maker, monkeypatch):
     settings.stripe_secret_key = "sk_test"
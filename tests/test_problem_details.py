@@ -9,9 +9,9 @@ def test_rate_limit_returns_problem_details(client):
     asyncio.run(limiter.reset())
     limiter.requests_per_minute = 1
     try:
-        first = client.get("/healthz")
-        assert first.status_code == 200
-        second = client.get("/healthz")
+        first = client.get("/ui/lang?lang=en", follow_redirects=False)
+        assert first.status_code == 307
+        second = client.get("/ui/lang?lang=en", follow_redirects=False)
         assert second.status_code == 429
         body = second.json()
         assert body["title"] == "Too Many Requests"
@@ -20,3 +20,57 @@ def test_rate_limit_returns_problem_details(client):
     finally:
         limiter.requests_per_minute = previous_limit
         asyncio.run(limiter.reset())
+
+
+def test_problem_details_response_renders_compact_problem_json():
+    from app.api.problem_details import ProblemJSONResponse
+
+    response = ProblemJSONResponse(status_code=400, content={"detail": "é", "errors": [{"field": "x"}]})
+
+    assert response.headers["content-type"] == "application/problem+json"
+    assert response.body == '{"detail":"é","errors":[{"field":"x"}]}'.encode()
+
+
+def test_format_error_field_drops_reserved_location_parts():
+    from app.main import _format_error_field
+
+    assert _format_error_field(("body", "items", 0, "qty")) == "items.0.qty"
+    assert _format_error_field(("query",)) == ""
+
+
+def test_problem_template_matches_problem_details_and_escapes_request_id():
+    import json
+
+    from starlette.requests import Request
+
+    from app.api.problem_details import SERVER_ERROR_PROBLEM, problem_details
+
+    def _request() -> Request:
+        request_id = b'req-"quoted"'
+        return Request({"type": "http", "headers": [(b"x-request-id", request_id)], "state": {}})
+
+    templated = SERVER_ERROR_PROBLEM.response(_request())
+    built = problem_details(
+        _request(),
+        status=500,
+        title="Internal Server Error",
+        detail="Unexpected error",
+    )
+
+    assert templated.status_code == 500
+    assert templated.headers["content-type"] == "application/problem+json"
+    assert templated.headers["X-Request-ID"] == 'req-"quoted"'
+    assert json.loads(templated.body) == json.loads(built.body)
+
+
+def test_problem_details_generates_hex_request_id_without_header():
+    from starlette.requests import Request
+
+    from app.api.problem_details import _resolve_request_id
+
+    request = Request({"type": "http", "headers": [], "state": {}})
+
+    request_id = _resolve_request_id(request)
+
+    assert len(request_id) == 32 and int(request_id, 16) >= 0
+    assert request.scope["state"]["request_id"] == request_id
@@ -60,3 +60,25 @@ def test_validate_prod_config_accepts_strong_secrets(monkeypatch):
     _disable_pytest_shortcuts(monkeypatch)
 
     main._validate_prod_config(settings_obj)
+
+
+def test_create_app_validates_prod_config_on_startup(monkeypatch):
+    from fastapi.testclient import TestClient
+
+    from app.settings import Settings
+
+    app = main.create_app(
+        Settings(
+            app_env="prod",
+            cors_origins=["https://example.com"],
+            auth_secret_key="super-secret",
+            client_portal_secret="client-secret",
+            worker_portal_secret="worker-secret",
+            metrics_enabled=False,
+        )
+    )
+    _disable_pytest_shortcuts(monkeypatch)
+
+    with pytest.raises(RuntimeError, match="Invalid production configuration"):
+        with TestClient(app):
+            pass
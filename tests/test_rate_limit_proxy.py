@@ -40,3 +40,25 @@ def test_resolve_client_key_ignores_untrusted_proxy():
         trusted_proxy_cidrs=[],
     )
     assert client == "203.0.113.5"
+
+
+def test_resolve_client_key_matches_cidr_and_memoizes_per_request():
+    request = _make_request("10.1.2.3", "198.51.100.10")
+    kwargs = {"trust_proxy_headers": True, "trusted_proxy_ips": [], "trusted_proxy_cidrs": ["bad", "10.0.0.0/8"]}
+
+    assert resolve_client_key(request, **kwargs) == "198.51.100.10"
+    assert request.scope["app.client_key"][1] == "198.51.100.10"
+    assert resolve_client_key(request, **{**kwargs, "trusted_proxy_cidrs": []}) == "10.1.2.3"
+
+
+def test_resolve_client_key_accepts_cidrs_with_host_bits():
+    request = _make_request("10.1.2.3", "198.51.100.10")
+
+    client = resolve_client_key(
+        request,
+        trust_proxy_headers=True,
+        trusted_proxy_ips=[],
+        trusted_proxy_cidrs=["10.1.2.0/8"],
+    )
+
+    assert client == "198.51.100.10"
@@ -13,8 +13,7 @@ from app.infra.security import InMemoryRateLimiter, RedisRateLimiter, create_rat
 class FakeRedis:
     def __init__(self) -> None:
         self._scripts: dict[str, str] = {}
-        self._zsets: dict[str, dict[str, int]] = {}
-        self._sequences: dict[str, int] = {}
+        self._buckets: dict[str, tuple[float, int]] = {}
         self._lock = asyncio.Lock()
         self.evalsha_calls = 0
 
@@ -35,13 +34,12 @@ class FakeRedis:
     async def flushdb(self):
         async with self._lock:
             self._scripts.clear()
-            self._zsets.clear()
-            self._sequences.clear()
+            self._buckets.clear()
             self.evalsha_calls = 0
 
     async def scan(self, cursor: int = 0, match: str | None = None, count: int | None = None):  # noqa: ARG002
         async with self._lock:
-            keys = set(self._zsets.keys()) | set(self._sequences.keys())
+            keys = set(self._buckets.keys())
             if match:
                 import fnmatch
 
@@ -50,55 +48,56 @@ class FakeRedis:
 
     async def delete(self, *keys: str):
         async with self._lock:
-            removed = 0
-            for key in keys:
-                if key in self._zsets:
-                    self._zsets.pop(key, None)
-                    removed += 1
-                if key in self._sequences:
-                    self._sequences.pop(key, None)
-                    removed += 1
-            return removed
+            return sum(self._buckets.pop(key, None) is not None for key in keys)
 
     async def aclose(self):
         return None
 
     async def _execute_script(self, numkeys: int, *args):
         async with self._lock:
-            keys = args[:numkeys]
+            (bucket_key,) = args[:numkeys]
             argv = args[numkeys:]
-            set_key, seq_key = keys
-            limit = int(argv[0])
+            capacity = int(argv[0])
             window_ms = int(argv[1])
             _ttl_seconds = int(argv[2])
+            requested = int(argv[3]) if len(argv) > 3 else 1
 
             now_ms = int(time.time() * 1000)
-            window_start = now_ms - window_ms
+            tokens, last_ms = self._buckets.get(bucket_key, (float(capacity), now_ms))
+            tokens = min(capacity, tokens + max(0, now_ms - last_ms) * capacity / window_ms)
 
-            zset = self._zsets.setdefault(set_key, {})
-            for member, score in list(zset.items()):
-                if score < window_start:
-                    zset.pop(member, None)
+            granted = min(requested, int(tokens))
+            self._buckets[bucket_key] = (tokens - granted, now_ms)
+            return granted
 
-            if len(zset) >= limit:
-                return 0
 
-            sequence = self._sequences.get(seq_key, 0) + 1
-            self._sequences[seq_key] = sequence
-            member = f"{now_ms}:{sequence}"
-            zset[member] = now_ms
+@pytest.mark.anyio
+async def test_inmemory_rate_limiter_blocks_after_limit():
+    limiter = InMemoryRateLimiter(requests_per_minute=2, cleanup_minutes=1)
 
-            return 1
+    assert await limiter.allow("client-1")
+    assert await limiter.allow("client-1")
+    assert not await limiter.allow("client-1")
 
 
 @pytest.mark.anyio
-async def test_inmemory_rate_limiter_blocks_after_limit():
+async def test_inmemory_rate_limiter_refills_lazily_and_evicts_idle_keys(monkeypatch):
+    clock = [1_000.0]
+    monkeypatch.setattr("app.infra.security.time.monotonic", lambda: clock[0])
     limiter = InMemoryRateLimiter(requests_per_minute=2, cleanup_minutes=1)
 
     assert await limiter.allow("client-1")
     assert await limiter.allow("client-1")
     assert not await limiter.allow("client-1")
 
+    clock[0] += 30  # one token refills every 30 seconds at 2 requests/minute
+    assert await limiter.allow("client-1")
+    assert not await limiter.allow("client-1")
+
+    clock[0] += 120
+    assert await limiter.allow("client-2")
+    assert "client-1" not in limiter._buckets
+
 
 @pytest.mark.anyio
 async def test_redis_rate_limiter_blocks_after_limit():
@@ -158,6 +157,115 @@ async def test_redis_rate_limiter_uses_lua_script():
     await limiter.close()
 
 
+@pytest.mark.anyio
+async def test_redis_rate_limiter_keeps_one_bucket_key_per_client():
+    fake_redis = FakeRedis()
+    limiter = RedisRateLimiter(
+        "redis://localhost:6379/0",
+        requests_per_minute=3,
+        cleanup_minutes=1,
+        redis_client=fake_redis,
+    )
+
+    for _ in range(3):
+        assert await limiter.allow("client-bucket")
+
+    assert list(fake_redis._buckets) == ["rate-limit:bucket:client-bucket"]
+    await limiter.reset()
+    assert fake_redis._buckets == {}
+
+    await limiter.close()
+
+
+@pytest.mark.anyio
+async def test_redis_rate_limiter_preload_registers_script():
+    fake_redis = FakeRedis()
+    limiter = RedisRateLimiter(
+        "redis://localhost:6379/0",
+        requests_per_minute=2,
+        cleanup_minutes=1,
+        redis_client=fake_redis,
+    )
+
+    await limiter.preload()
+    assert limiter._script_sha in fake_redis._scripts
+
+    assert await limiter.allow("client-preload")
+    assert len(fake_redis._scripts) == 1
+
+    await limiter.close()
+
+
+@pytest.mark.anyio
+async def test_redis_rate_limiter_spends_prefetched_tokens_locally():
+    fake_redis = FakeRedis()
+    limiter = RedisRateLimiter(
+        "redis://localhost:6379/0",
+        requests_per_minute=5,
+        cleanup_minutes=1,
+        redis_client=fake_redis,
+        local_tokens=3,
+        local_ttl_seconds=60,
+    )
+
+    results = [await limiter.allow("client-batch") for _ in range(6)]
+
+    assert results == [True, True, True, True, True, False]
+    # Two batches (3 + 2 tokens) and one denied call reach Redis instead of six calls.
+    assert fake_redis.evalsha_calls == 3
+
+    await limiter.close()
+
+
+@pytest.mark.anyio
+async def test_try_allow_fast_decides_locally_or_defers():
+    in_memory = InMemoryRateLimiter(requests_per_minute=1, cleanup_minutes=1)
+    assert in_memory.try_allow_fast("client-fast") is True
+    assert in_memory.try_allow_fast("client-fast") is False
+
+    fake_redis = FakeRedis()
+    limiter = RedisRateLimiter(
+        "redis://localhost:6379/0",
+        requests_per_minute=5,
+        cleanup_minutes=1,
+        redis_client=fake_redis,
+        local_tokens=2,
+        local_ttl_seconds=60,
+    )
+    assert limiter.try_allow_fast("client-fast") is None
+    assert await limiter.allow("client-fast")
+    assert limiter.try_allow_fast("client-fast") is True
+    assert limiter.try_allow_fast("client-fast") is None
+    assert fake_redis.evalsha_calls == 1
+
+    await limiter.close()
+
+
+@pytest.mark.anyio
+async def test_redis_rate_limiter_local_tokens_expire(monkeypatch):
+    fake_redis = FakeRedis()
+    limiter = RedisRateLimiter(
+        "redis://localhost:6379/0",
+        requests_per_minute=10,
+        cleanup_minutes=1,
+        redis_client=fake_redis,
+        local_tokens=4,
+        local_ttl_seconds=0.5,
+    )
+    clock = [1000.0]
+    monkeypatch.setattr("app.infra.security.time.monotonic", lambda: clock[0])
+
+    assert await limiter.allow("client-ttl")
+    assert await limiter.allow("client-ttl")
+    assert fake_redis.evalsha_calls == 1
+
+    clock[0] += 1.0
+    assert await limiter.allow("client-ttl")
+    assert fake_redis.evalsha_calls == 2
+
+    await limiter.close()
+
+
 @pytest.mark.anyio
 async def test_redis_rate_limiter_falls_back_to_inmemory_on_redis_errors():
     class BrokenRedis(FakeRedis):
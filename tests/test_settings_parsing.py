@@ -33,6 +33,17 @@ def test_list_env_parsing(monkeypatch, env_name, attr_name, env_value, expected)
     assert getattr(settings, attr_name) == expected
 
 
+def test_list_settings_track_raw_value_and_return_fresh_lists():
+    settings = Settings(app_env="dev", trusted_proxy_ips="10.0.0.1, 10.0.0.2", _env_file=None)
+
+    first = settings.trusted_proxy_ips
+    first.append("mutated")
+    assert settings.trusted_proxy_ips == ["10.0.0.1", "10.0.0.2"]
+
+    settings.trusted_proxy_ips = ["10.0.0.3"]
+    assert settings.trusted_proxy_ips == ["10.0.0.3"]
+
+
 def test_dev_defaults_allow_placeholders():
     settings = Settings(app_env="dev", _env_file=None)
 
@@ -144,3 +155,20 @@ def test_legacy_basic_auth_defaults_enabled_in_dev():
     settings = Settings(app_env="dev", _env_file=None)
 
     assert settings.legacy_basic_auth_enabled is True
+
+
+@pytest.mark.parametrize(
+    "value, expected_raw",
+    [
+        (["https://a.com", "https://b.com"], "https://a.com,https://b.com"),
+        (["a,b", "c"], '["a,b", "c"]'),
+        (["[::1]"], '["[::1]"]'),
+    ],
+)
+def test_list_setter_prefers_comma_form(value, expected_raw):
+    settings = Settings(app_env="dev", _env_file=None)
+
+    settings.cors_origins = value
+
+    assert settings.cors_origins_raw == expected_raw
+    assert settings.cors_origins == value
@@ -0,0 +1,76 @@
+import time
+
+import pytest
+
+from app.infra.storage.backends import InMemoryStorageBackend, S3StorageBackend
+
+
+class _FakeS3Client:
+    def __init__(self, objects: dict[str, bytes]) -> None:
+        self.objects = objects
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def get_object(self, Bucket: str, Key: str):  # noqa: N802, ANN001, ANN201
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(0.01)
+            payload = self.objects[Key]
+        finally:
+            self.in_flight -= 1
+        return {"Body": type("_Body", (), {"read": lambda self: payload})()}
+
+    def get_paginator(self, name: str):  # noqa: ANN001, ANN201
+        objects = self.objects
+
+        class _Paginator:
+            def paginate(self, Bucket: str, Prefix: str):  # noqa: N802, ANN001, ANN201
+                yield {"Contents": [{"Key": key} for key in sorted(objects) if key.startswith(Prefix)]}
+
+        return _Paginator()
+
+
+def _backend(client: _FakeS3Client) -> S3StorageBackend:
+    return S3StorageBackend(
+        bucket="bucket",
+        access_key="access",
+        secret_key="secret",
+        enable_circuit_breaker=False,
+        client=client,
+    )
+
+
+@pytest.mark.anyio
+async def test_read_many_preserves_order_and_bounds_concurrency():
+    client = _FakeS3Client({f"k{i}": f"v{i}".encode() for i in range(8)})
+    backend = _backend(client)
+
+    payloads = await backend.read_many(keys=[f"k{i}" for i in range(8)], concurrency=3)
+
+    assert payloads == [f"v{i}".encode() for i in range(8)]
+    assert 1 < client.max_in_flight <= 3
+
+
+@pytest.mark.anyio
+async def test_iter_prefix_yields_listed_objects_in_order():
+    client = _FakeS3Client({"a/1": b"one", "a/2": b"two", "a/3": b"three", "b/1": b"other"})
+    backend = _backend(client)
+
+    items = [item async for item in backend.iter_prefix(prefix="a/", prefetch=2)]
+
+    assert items == [("a/1", b"one"), ("a/2", b"two"), ("a/3", b"three")]
+
+
+@pytest.mark.anyio
+async def test_default_read_many_and_iter_prefix_on_other_backends():
+    backend = InMemoryStorageBackend()
+    for key, payload in {"a/2": b"two", "a/1": b"one", "b/1": b"other"}.items():
+        await backend.put(key=key, body=_chunks(payload), content_type="text/plain")
+
+    assert await backend.read_many(keys=["a/2", "b/1"]) == [b"two", b"other"]
+    assert [item async for item in backend.iter_prefix(prefix="a/")] == [("a/1", b"one"), ("a/2", b"two")]
+
+
+async def _chunks(payload: bytes):
+    yield payload
@@ -104,6 +104,26 @@ class TestLocalStorageBackendSignedUrls:
         is_valid = backend.validate_signed_get_url(key=key, url=signed_url)
         assert is_valid is False
 
+    def test_signed_url_validation_reads_query_params_only(self, tmp_path):
+        """
+        Test that exp/sig are read from the query string regardless of extra params.
+        """
+        backend = LocalStorageBackend(
+            root=tmp_path,
+            signing_secret="test-secret-key-for-hmac-signing"
+        )
+
+        key = "test-file.txt"
+        resource_url = "https://api.example.test/download?variant=thumb"
+        signed_url = asyncio.run(
+            backend.generate_signed_get_url(key=key, expires_in=3600, resource_url=resource_url)
+        )
+
+        assert backend.validate_signed_get_url(key=key, url=f"{signed_url}#frag") is True
+        assert backend.validate_signed_get_url(key=key, url=signed_url.split("?")[0]) is False
+        assert backend.validate_signed_get_url(key=key, url=signed_url.replace("exp=", "exp=x")) is False
+        assert backend.validate_signed_get_url(key=key, url=signed_url.replace("&sig=", "&nosig=")) is False
+
     def test_signed_url_validation_uses_constant_time_comparison(self, tmp_path):
         """
         Test that signature validation uses constant-time comparison.
@@ -222,3 +242,26 @@ class TestInMemoryStorageBackendSignedUrls:
             assert read_content == content
 
         asyncio.run(workflow())
+
+    def test_in_memory_backend_list_by_prefix(self):
+        """
+        Test that listing returns only keys under the prefix and tracks deletes.
+        """
+        backend = InMemoryStorageBackend()
+
+        async def workflow():
+            async def content_iterator():
+                yield b"x"
+
+            for key in ["orders/b/2", "orders/a/1", "orders/a/2", "orders/ab/1", "other/1"]:
+                await backend.put(key=key, body=content_iterator(), content_type="text/plain")
+            await backend.put(key="orders/a/1", body=content_iterator(), content_type="text/plain")
+
+            assert await backend.list(prefix="orders/a/") == ["orders/a/1", "orders/a/2"]
+            assert len(await backend.list()) == 5
+
+            await backend.delete(key="orders/a/1")
+            await backend.delete(key="orders/missing")
+            assert await backend.list(prefix="orders/a") == ["orders/a/2", "orders/ab/1"]
+
+        asyncio.run(workflow())